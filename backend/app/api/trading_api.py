@@ -13,7 +13,7 @@ from app.trading.coordinator import TradeCoordinator
 from app.trading.models import OrderSide, ExecutionStrategy
 from app.server.provider_manager import ProviderManager
 from app.server.connection_manager import ConnectionManager
-from app.risk import RiskLimits
+from app.risk import RiskLimits, PositionCalculator
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -336,7 +336,8 @@ async def get_stats(
         return {
             "trade_stats": coordinator.get_trade_stats(),
             "pnl": coordinator.get_pnl_summary(),
-            "risk": coordinator.get_risk_status()
+            "risk": coordinator.get_risk_status(),
+            "calculator_cache": PositionCalculator.cache_info()
         }
         
     except Exception as e:
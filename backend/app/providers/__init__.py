@@ -1,6 +1,6 @@
 """Data providers module for betting exchanges."""
 
-from .base import BaseDataProvider
+from .base import BaseDataProvider, KeepAliveScheduler
 from .betfair import BetfairProvider
 from .factory import DataProviderFactory
 from .models import (
@@ -15,6 +15,7 @@ from .models import (
 
 __all__ = [
     "BaseDataProvider",
+    "KeepAliveScheduler",
     "BetfairProvider", 
     "DataProviderFactory",
     "StreamMessage",
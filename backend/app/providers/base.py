@@ -1,17 +1,29 @@
 """Abstract base class for data providers."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple, Union
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+import asyncio
 import logging
+import threading
+
+import orjson
+
+from ..utils.slots import add_slots
 from .models import StreamMessage, StreamConfig, MarketPrices, StreamStatus
 from .tennis_models import TennisMatch, TennisScore, MatchStatistics, Player
 
 
-@dataclass
+@add_slots
+@dataclass(eq=False)
 class Match:
-    """Tennis match data model."""
+    """
+    Tennis match data model.
+    
+    Identity is the match id: equality and hashing only look at id, and
+    the hash is computed once at construction, so id must not change.
+    """
     id: str
     event_name: str
     competition: str
@@ -20,19 +32,66 @@ class Match:
     home_player: str
     away_player: str
     metadata: Dict[str, Any] = None
+    _hash: int = field(init=False, repr=False, compare=False, default=0)
+    
+    def __post_init__(self):
+        self._hash = hash(self.id)
+    
+    def __hash__(self):
+        return self._hash
+    
+    def __eq__(self, other):
+        if not isinstance(other, Match):
+            return NotImplemented
+        return self.id == other.id
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a shallow dictionary."""
+        return {
+            "id": self.id,
+            "event_name": self.event_name,
+            "competition": self.competition,
+            "market_start_time": self.market_start_time,
+            "status": self.status,
+            "home_player": self.home_player,
+            "away_player": self.away_player,
+            "metadata": self.metadata
+        }
+    
+    def to_json(self, _dumps=orjson.dumps) -> bytes:
+        """Serialize to JSON bytes."""
+        return _dumps(self, option=orjson.OPT_NON_STR_KEYS)
 
 
+@add_slots
 @dataclass
 class PriceData:
     """Market price data model."""
     selection_id: str
     selection_name: str
-    back_prices: List[Dict[str, float]]  # [{"price": x, "size": y}]
-    lay_prices: List[Dict[str, float]]
+    back_prices: List[Tuple[float, float]]  # [(price, size)]
+    lay_prices: List[Tuple[float, float]]
     last_price_traded: Optional[float] = None
     total_matched: Optional[float] = None
     available_to_back: Optional[float] = None
     available_to_lay: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a shallow dictionary."""
+        return {
+            "selection_id": self.selection_id,
+            "selection_name": self.selection_name,
+            "back_prices": self.back_prices,
+            "lay_prices": self.lay_prices,
+            "last_price_traded": self.last_price_traded,
+            "total_matched": self.total_matched,
+            "available_to_back": self.available_to_back,
+            "available_to_lay": self.available_to_lay
+        }
+    
+    def to_json(self, _dumps=orjson.dumps) -> bytes:
+        """Serialize to JSON bytes."""
+        return _dumps(self, option=orjson.OPT_NON_STR_KEYS)
 
 
 @dataclass
@@ -44,6 +103,21 @@ class Score:
     current_set: int
     server: Optional[str] = None
     timestamp: datetime = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a shallow dictionary."""
+        return {
+            "match_id": self.match_id,
+            "home_score": self.home_score,
+            "away_score": self.away_score,
+            "current_set": self.current_set,
+            "server": self.server,
+            "timestamp": self.timestamp
+        }
+    
+    def to_json(self, _dumps=orjson.dumps) -> bytes:
+        """Serialize to JSON bytes."""
+        return _dumps(self, option=orjson.OPT_NON_STR_KEYS)
 
 
 @dataclass
@@ -53,10 +127,36 @@ class MatchStats:
     home_stats: Dict[str, Any]  # {"aces": 5, "double_faults": 2, etc.}
     away_stats: Dict[str, Any]
     timestamp: datetime = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a shallow dictionary."""
+        return {
+            "match_id": self.match_id,
+            "home_stats": self.home_stats,
+            "away_stats": self.away_stats,
+            "timestamp": self.timestamp
+        }
+    
+    def to_json(self, _dumps=orjson.dumps) -> bytes:
+        """Serialize to JSON bytes."""
+        return _dumps(self, option=orjson.OPT_NON_STR_KEYS)
 
 
 class BaseDataProvider(ABC):
-    """Abstract base class for all betting data providers."""
+    """
+    Abstract base class for all betting data providers.
+    
+    Subclasses register themselves with DataProviderFactory by passing a
+    name in the class statement: class MyProvider(BaseDataProvider, name="my").
+    """
+    
+    # Provider name -> class, filled in as subclasses are defined
+    _registry: Dict[str, type] = {}
+    
+    def __init_subclass__(cls, name: Optional[str] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if name:
+            BaseDataProvider._registry[name.lower()] = cls
     
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize the provider with optional logger."""
@@ -64,6 +164,63 @@ class BaseDataProvider(ABC):
         self.is_authenticated = False
         self.session_token = None
         
+    def _codegen_parser(
+        self,
+        schema: Dict[str, str],
+        converters: Optional[Dict[str, Callable[[Any], Any]]] = None,
+        target: type = PriceData
+    ) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Generate a specialized parser for a known message schema.
+        
+        The parser is compiled once into straight-line code, so the hot
+        path does no per-field dispatch. Nested keys are separated by dots
+        ("ex.availableToBack"); each intermediate dict is looked up once.
+        
+        Args:
+            schema: Mapping of target field name to message key path
+            converters: Optional per-field functions applied to the raw value
+            target: Class to construct (default: PriceData)
+            
+        Returns:
+            Function taking a raw message dict and returning a target instance
+        """
+        converters = converters or {}
+        unknown = (set(schema) | set(converters)) - {f.name for f in fields(target)}
+        if unknown:
+            raise ValueError(f"Unknown {target.__name__} fields: {', '.join(sorted(unknown))}")
+        
+        namespace: Dict[str, Any] = {"_target": target, "_empty": {}}
+        lines = []
+        parents: Dict[str, str] = {}
+        args = []
+        
+        for i, (name, path) in enumerate(schema.items()):
+            *prefix, key = path.split(".")
+            
+            # Hoist each intermediate dict into a local
+            source = "msg"
+            for depth in range(len(prefix)):
+                parent_path = ".".join(prefix[:depth + 1])
+                if parent_path not in parents:
+                    local = f"_p{len(parents)}"
+                    lines.append(f"    {local} = {source}.get({prefix[depth]!r}) or _empty")
+                    parents[parent_path] = local
+                source = parents[parent_path]
+            
+            expr = f"{source}.get({key!r})"
+            if name in converters:
+                namespace[f"_c{i}"] = converters[name]
+                expr = f"_c{i}({expr})"
+            args.append(f"{name}={expr}")
+        
+        src = "def _parse(msg):\n"
+        src += "".join(line + "\n" for line in lines)
+        src += f"    return _target({', '.join(args)})\n"
+        
+        exec(compile(src, f"<parser:{self.__class__.__name__}>", "exec"), namespace)
+        return namespace["_parse"]
+    
     @abstractmethod
     def authenticate(self) -> bool:
         """
@@ -157,7 +314,6 @@ class BaseDataProvider(ABC):
         """
         pass
     
-    @abstractmethod
     def get_serving_player(self, match_id: str) -> Optional[Player]:
         """
         Get current serving player.
@@ -168,7 +324,8 @@ class BaseDataProvider(ABC):
         Returns:
             Player object of current server or None
         """
-        pass
+        score = self.get_match_score(match_id)
+        return score.server if score else None
     
     # ============== Trading Methods ==============
     
@@ -220,6 +377,48 @@ class BaseDataProvider(ABC):
         """
         pass
     
+    async def aplace_back_bet(
+        self,
+        market_id: str,
+        selection_id: str,
+        price: float,
+        size: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Place a back bet from async code.
+        
+        Runs place_back_bet in a worker thread by default; providers that
+        can batch placements override this.
+        
+        Returns:
+            Dict with bet details and status
+        """
+        return await asyncio.to_thread(
+            self.place_back_bet, market_id, selection_id, price, size, **kwargs
+        )
+    
+    async def aplace_lay_bet(
+        self,
+        market_id: str,
+        selection_id: str,
+        price: float,
+        size: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Place a lay bet from async code.
+        
+        Runs place_lay_bet in a worker thread by default; providers that
+        can batch placements override this.
+        
+        Returns:
+            Dict with bet details and status
+        """
+        return await asyncio.to_thread(
+            self.place_lay_bet, market_id, selection_id, price, size, **kwargs
+        )
+    
     @abstractmethod
     def cancel_bet(self, bet_id: str, size_reduction: Optional[float] = None) -> bool:
         """
@@ -374,6 +573,18 @@ class BaseDataProvider(ABC):
         """
         pass
     
+    async def akeep_alive(self) -> bool:
+        """
+        Keep the session alive without blocking the event loop.
+        
+        The default runs the blocking keep_alive() in a worker thread.
+        Providers with a native async client can override this.
+        
+        Returns:
+            bool: True if session is still valid
+        """
+        return await asyncio.to_thread(self.keep_alive)
+    
     def is_connected(self) -> bool:
         """Check if provider is connected and authenticated."""
         return self.is_authenticated
@@ -443,10 +654,17 @@ class BaseDataProvider(ABC):
         pass
     
     @abstractmethod
-    def handle_stream_message(self, message: Any) -> Optional[StreamMessage]:
+    def handle_stream_message(
+        self,
+        message: Union[bytes, bytearray, memoryview, str, Any]
+    ) -> Optional[StreamMessage]:
         """
         Parse and handle a raw stream message.
         
+        Implementations must accept the raw wire bytes (bytes, bytearray
+        or memoryview) and parse them directly, without decoding to str
+        first. str frames are still accepted.
+        
         Args:
             message: Raw message from the stream
             
@@ -467,4 +685,96 @@ class BaseDataProvider(ABC):
     
     def is_stream_connected(self) -> bool:
         """Check if stream is connected."""
-        return self.get_stream_status() == StreamStatus.CONNECTED
\ No newline at end of file
+        return self.get_stream_status() == StreamStatus.CONNECTED
+
+
+class KeepAliveScheduler:
+    """Keeps the sessions of many providers alive from a single task."""
+    
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        """Initialize the scheduler with optional logger."""
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    async def run(self, providers: List[BaseDataProvider], interval: int = 1200) -> None:
+        """
+        Send keep-alives for all authenticated providers every interval.
+        
+        Args:
+            providers: Providers to keep alive
+            interval: Seconds between keep-alive rounds
+        """
+        while True:
+            await asyncio.sleep(interval)
+            
+            active = [p for p in providers if p.is_authenticated]
+            results = await asyncio.gather(
+                *(p.akeep_alive() for p in active),
+                return_exceptions=True
+            )
+            
+            for provider, result in zip(active, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Keep-alive error for {provider.__class__.__name__}: {result}")
+                elif not result:
+                    self.logger.warning(f"Keep-alive failed for {provider.__class__.__name__}")
+    
+    def start(self, providers: List[BaseDataProvider], interval: int = 1200) -> None:
+        """
+        Start the scheduler.
+        
+        Runs as a task on the current event loop if one is running,
+        otherwise on a new event loop in a dedicated daemon thread.
+        
+        Args:
+            providers: Providers to keep alive
+            interval: Seconds between keep-alive rounds
+        """
+        if self.is_running():
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if loop:
+            self._task = loop.create_task(self.run(providers, interval))
+            return
+        
+        self._loop = asyncio.new_event_loop()
+        self._task = self._loop.create_task(self.run(providers, interval))
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop the scheduler."""
+        if not self._task:
+            return
+        
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+            if self._thread:
+                self._thread.join(timeout=5)
+            self._loop = None
+            self._thread = None
+        else:
+            self._task.cancel()
+        
+        self._task = None
+    
+    def is_running(self) -> bool:
+        """Check if the scheduler is running."""
+        return self._task is not None and not self._task.done()
+    
+    def _run_loop(self) -> None:
+        """Drive the private event loop until the scheduler task ends."""
+        loop = self._loop
+        try:
+            loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.close()
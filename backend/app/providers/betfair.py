@@ -1,12 +1,20 @@
 """Betfair data provider implementation."""
 
 import os
+import time
+import random
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Callable
-from datetime import datetime, timedelta
 import threading
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple, Union
+from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 from betfairlightweight import APIClient
 from betfairlightweight.exceptions import BetfairError
 from betfairlightweight import filters
@@ -18,17 +26,119 @@ from .base import (
     Score, 
     MatchStats
 )
-from .models import StreamMessage, StreamConfig, StreamStatus
-from .betfair_stream import BetfairStreamClient
+from .models import StreamMessage, StreamConfig, StreamStatus, MessageType
+from .betfair_stream import BetfairStreamClient, intern_runner_id, parse_market_change
 from .tennis_models import TennisMatch, TennisScore, MatchStatistics, Player, MatchStatus
 from .normalizer import MatchNormalizer
+from ..utils.rate_limit import TokenBucket
+
+
+# Prices and stakes are held as integer hundredths (price ticks / pence) so
+# they compare exactly and reach the API with exactly two decimal places
+_PRICE_SCALE = 100
+_SIZE_SCALE = 100
+
+
+def _to_units(value: float, scale: int) -> int:
+    """Convert a price or size to integer units."""
+    return int(round(value * scale))
+
+
+def _from_units(units: int, scale: int) -> float:
+    """Convert integer units back to a price or size."""
+    return units / scale
+
 
+def _ladder(price_sizes: Optional[List[Dict[str, float]]]) -> List[Tuple[float, float]]:
+    """Copy a Betfair price ladder into PriceData's (price, size) format."""
+    if not price_sizes:
+        return []
+    return [
+        (ps.get('price', 0), ps.get('size', 0))
+        for ps in price_sizes
+    ]
 
-class BetfairProvider(BaseDataProvider):
+
+class _ThrottledSession(requests.Session):
+    """requests session that takes a rate limiter token before each request."""
+    
+    def __init__(self, limiter: TokenBucket):
+        super().__init__()
+        self.limiter = limiter
+    
+    def request(self, *args, **kwargs):
+        self.limiter.acquire()
+        return super().request(*args, **kwargs)
+
+
+class BetfairProvider(BaseDataProvider, name="betfair"):
     """Betfair betting exchange data provider."""
     
     TENNIS_EVENT_TYPE_ID = "2"  # Tennis sport ID in Betfair
     
+    # listMarketBook allows a data weight of 200 per request; EX_BEST_OFFERS
+    # (depth 3) weighs 5 and EX_TRADED 17 per market
+    MARKET_BOOK_BATCH_SIZE = 200 // (5 + 17)
+    
+    # Concurrent listMarketBook requests (must not exceed the HTTP pool size)
+    PRICE_FETCH_WORKERS = 8
+    
+    # Request payloads are built once and shared by every call
+    PRICE_PROJECTION = filters.price_projection(
+        price_data=['EX_BEST_OFFERS', 'EX_TRADED'],
+        ex_best_offers_overrides=filters.ex_best_offers_overrides(
+            best_prices_depth=3
+        )
+    )
+    MARKET_BOOK_PROJECTION = {
+        'priceData': ['EX_BEST_OFFERS', 'EX_TRADED'],
+        'virtualise': True
+    }
+    BEST_OFFERS_PROJECTION = filters.price_projection(price_data=["EX_BEST_OFFERS"])
+    
+    # Match listings only need best offers (weight 5), which fits 40 markets
+    # per request; adding EX_TRADED cuts that to 5 so it is opt-in
+    MATCH_BOOK_PROJECTION = {
+        'priceData': ['EX_BEST_OFFERS'],
+        'virtualise': True
+    }
+    MATCH_BOOK_BATCH_SIZE = 200 // 5
+    LIVE_MATCHES_FILTER = filters.market_filter(
+        event_type_ids=[TENNIS_EVENT_TYPE_ID],
+        market_type_codes=["MATCH_ODDS"],
+        in_play_only=True
+    )
+    
+    # REST request rate shared by every caller (requests per second, burst)
+    REST_RATE = 10
+    REST_BURST = 20
+    
+    # Seconds of API inactivity before a scheduled keep-alive is sent
+    KEEP_ALIVE_IDLE = 600
+    
+    # Placed bet cache bounds
+    BET_META_MAX_SIZE = 10_000
+    BET_META_TTL = 3600  # Seconds
+    
+    # Settled bet cache bounds: market filters kept, and how long a filter's
+    # rows are reused before they are fetched again from scratch
+    CLEARED_CACHE_MAX_SIZE = 256
+    CLEARED_CACHE_TTL = 3600  # Seconds
+    
+    # Async bet placement coalescing (placeOrders accepts 200 instructions)
+    PLACE_BATCH_DELAY = 0.001  # Seconds
+    PLACE_BATCH_MAX = 200
+    
+    # Market book runner (lightweight dict) -> PriceData field mapping
+    PRICE_SCHEMA = {
+        "selection_id": "selectionId",
+        "selection_name": "selectionId",  # Name not available in lightweight mode
+        "back_prices": "ex.availableToBack",
+        "lay_prices": "ex.availableToLay",
+        "last_price_traded": "lastPriceTraded",
+        "total_matched": "totalMatched"
+    }
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize Betfair provider."""
         super().__init__(logger)
@@ -42,6 +152,12 @@ class BetfairProvider(BaseDataProvider):
         # Validate configuration
         self._validate_config()
         
+        # Monotonic time of the last API response
+        self.last_activity = 0.0
+        
+        # Throttles every REST call made through the client's session
+        self._rest_limiter = TokenBucket(rate=self.REST_RATE, burst=self.REST_BURST)
+        
         # Initialize API client
         # For a single .pem file, use cert_files parameter
         self.client = APIClient(
@@ -49,17 +165,34 @@ class BetfairProvider(BaseDataProvider):
             password=self.password,
             app_key=self.app_key,
             cert_files=self.cert_file,  # Single .pem file
-            lightweight=True
+            lightweight=True,
+            session=self._create_http_session()
         )
         
-        # Session management
+        # Session management (keep-alives are driven by KeepAliveScheduler)
         self.last_keep_alive = None
-        self.keep_alive_interval = 600  # 10 minutes
-        self._keep_alive_thread = None
-        self._stop_keep_alive = threading.Event()
+        
+        # Placed bet details, so cancel/update can skip a lookup round-trip
+        self._bet_meta: "OrderedDict[str, Tuple[str, str, str, int, float]]" = OrderedDict()
+        self._bet_meta_lock = threading.Lock()
+        
+        # Settled bets by market filter (None = all markets): rows by betId,
+        # the newest settledDate seen (so only new rows are fetched) and
+        # when the rows were first fetched
+        self._cleared_cache: "OrderedDict[Optional[str], Tuple[Dict[str, Dict[str, Any]], Optional[str], float]]" = OrderedDict()
+        self._cleared_lock = threading.Lock()
+        
+        # Queued (market_id, instruction, price_units, future) awaiting a
+        # shared placeOrders call, and the pending flush timer and its loop
+        self._pending_places: List[Tuple[str, Dict[str, Any], int, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # In-flight placeOrders tasks, held so they are not garbage-collected
+        self._place_tasks: Set[asyncio.Task] = set()
         
         # Price subscription management
-        self._price_subscriptions = {}
+        self._price_subscriptions = set()
         self._price_callback = None
         
         # Streaming
@@ -69,6 +202,46 @@ class BetfairProvider(BaseDataProvider):
         # Tennis data
         self.normalizer = MatchNormalizer(logger)
         
+        # Specialized market book runner parser
+        self._parse_message = self._codegen_parser(
+            self.PRICE_SCHEMA,
+            converters={
+                "selection_id": str,
+                "selection_name": str,
+                "back_prices": _ladder,
+                "lay_prices": _ladder
+            }
+        )
+        
+    def _create_http_session(self) -> requests.Session:
+        """
+        Create a pooled HTTP session for the API client.
+        
+        Without a session betfairlightweight opens a new TCP/TLS
+        connection per request; the pool keeps connections alive.
+        Every request is rate limited, and every response marks the
+        session as recently used.
+        """
+        session = _ThrottledSession(self._rest_limiter)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, pool_block=False)
+        session.mount("https://", adapter)
+        session.hooks["response"].append(self._touch)
+        return session
+    
+    def _touch(self, response, *args, **kwargs) -> None:
+        """Record API activity; any authenticated call extends the session."""
+        self.last_activity = time.monotonic()
+        
+        # Back off when throttled, with jitter so callers don't retry in step
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                return
+            self.logger.warning(f"Betfair asked to retry after {delay}s")
+            self._rest_limiter.pause(delay + random.uniform(0, 1))
+    
     def _validate_config(self):
         """Validate required configuration is present."""
         missing = []
@@ -102,9 +275,6 @@ class BetfairProvider(BaseDataProvider):
             self.session_token = self.client.session_token
             self.last_keep_alive = datetime.now()
             
-            # Start keep-alive thread
-            self._start_keep_alive_thread()
-            
             self.logger.info(f"Successfully authenticated with Betfair. Session token: {self.session_token[:20]}...")
             return True
             
@@ -115,31 +285,6 @@ class BetfairProvider(BaseDataProvider):
             self.logger.error(f"Unexpected error during authentication: {e}")
             return False
     
-    def _start_keep_alive_thread(self):
-        """Start background thread to keep session alive."""
-        if self._keep_alive_thread and self._keep_alive_thread.is_alive():
-            return
-            
-        self._stop_keep_alive.clear()
-        self._keep_alive_thread = threading.Thread(target=self._keep_alive_worker)
-        self._keep_alive_thread.daemon = True
-        self._keep_alive_thread.start()
-    
-    def _keep_alive_worker(self):
-        """Background worker to maintain session."""
-        while not self._stop_keep_alive.is_set():
-            try:
-                # Wait for interval or stop signal
-                if self._stop_keep_alive.wait(self.keep_alive_interval):
-                    break
-                    
-                # Send keep alive
-                if self.is_authenticated:
-                    self.keep_alive()
-                    
-            except Exception as e:
-                self.logger.error(f"Keep-alive error: {e}")
-    
     def get_live_matches(self, sport: str = "tennis") -> List[Match]:
         """
         Get list of live tennis matches.
@@ -152,16 +297,9 @@ class BetfairProvider(BaseDataProvider):
             return []
             
         try:
-            # Create filter for in-play tennis matches
-            market_filter = filters.market_filter(
-                event_type_ids=[self.TENNIS_EVENT_TYPE_ID],
-                market_type_codes=["MATCH_ODDS"],
-                in_play_only=True
-            )
-            
-            # Get markets
+            # Get in-play tennis markets
             markets = self.client.betting.list_market_catalogue(
-                filter=market_filter,
+                filter=self.LIVE_MATCHES_FILTER,
                 market_projection=["EVENT", "MARKET_START_TIME", "RUNNER_DESCRIPTION", "COMPETITION"],
                 max_results=100
             )
@@ -206,8 +344,9 @@ class BetfairProvider(BaseDataProvider):
         """
         Subscribe to price updates for markets.
         
-        Note: This is a polling implementation. For real-time streaming,
-        you would need to implement Betfair's Exchange Stream API.
+        Updates are pushed over the Exchange Stream API; the stream is
+        connected on first use. The callback receives one PriceData per
+        runner in each market change.
         """
         if not self.is_authenticated:
             self.logger.error("Not authenticated")
@@ -216,14 +355,25 @@ class BetfairProvider(BaseDataProvider):
         try:
             self._price_callback = callback
             
-            for market_id in market_ids:
-                if market_id not in self._price_subscriptions:
-                    self._price_subscriptions[market_id] = True
-                    self.logger.info(f"Subscribed to prices for market {market_id}")
-                    
-            # In a real implementation, you would start streaming here
-            # For now, we'll use polling in get_market_prices
-            return True
+            self._price_subscriptions.update(market_ids)
+            self.logger.info(f"Subscribed to prices for markets {market_ids}")
+            
+            subscription = dict(
+                market_ids=market_ids,
+                callback=self._dispatch_stream_message,
+                fields=["EX_BEST_OFFERS", "EX_LTP", "EX_MARKET_DEF"],
+                ladder_levels=3
+            )
+            
+            # Subscribe in the same round-trip as authentication on first use
+            if not self.is_stream_connected():
+                if not self._get_stream_client().connect_and_subscribe(**subscription):
+                    self._price_subscriptions.difference_update(market_ids)
+                    self.logger.error("Could not connect stream for price subscription")
+                    return False
+                return True
+            
+            return self.stream_client.subscribe_markets(**subscription)
             
         except Exception as e:
             self.logger.error(f"Error subscribing to prices: {e}")
@@ -232,83 +382,82 @@ class BetfairProvider(BaseDataProvider):
     def unsubscribe_from_prices(self, market_ids: List[str]) -> bool:
         """Unsubscribe from price updates."""
         try:
-            for market_id in market_ids:
-                if market_id in self._price_subscriptions:
-                    del self._price_subscriptions[market_id]
-                    self.logger.info(f"Unsubscribed from market {market_id}")
+            removed = [m for m in market_ids if m in self._price_subscriptions]
+            self._price_subscriptions.difference_update(removed)
+            if removed:
+                self.logger.info(f"Unsubscribed from markets {removed}")
+            
+            if removed and self.stream_client:
+                self.stream_client.unsubscribe_markets(removed)
             return True
         except Exception as e:
             self.logger.error(f"Error unsubscribing: {e}")
             return False
     
+    def _dispatch_stream_message(self, message: StreamMessage) -> None:
+        """Route a stream message to the stream and price callbacks."""
+        if self._stream_callback:
+            self._stream_callback(message)
+        
+        if not self._price_callback or message.type != MessageType.MARKET_CHANGE:
+            return
+        
+        # Coalesced updates may carry several markets in one message
+        markets = message.data if isinstance(message.data, list) else (message.data,)
+        for market_prices in markets:
+            market_id = market_prices.market_id
+            if market_id not in self._price_subscriptions:
+                continue
+            for runner in market_prices.runners:
+                self._price_callback(market_id, PriceData(
+                    selection_id=runner.runner_id,
+                    selection_name=runner.runner_name or runner.runner_id,
+                    back_prices=[(pv.price, pv.volume) for pv in runner.back_prices],
+                    lay_prices=[(pv.price, pv.volume) for pv in runner.lay_prices],
+                    last_price_traded=runner.last_traded_price,
+                    total_matched=runner.total_matched
+                ))
+    
     def get_market_prices(self, market_id: str) -> Optional[List[PriceData]]:
         """Get current prices for a market."""
-        if not self.is_authenticated:
-            return None
+        return self.get_market_prices_bulk([market_id]).get(market_id)
+    
+    def get_market_prices_bulk(self, market_ids: List[str]) -> Dict[str, List[PriceData]]:
+        """
+        Get current prices for many markets in as few requests as possible.
+        
+        Args:
+            market_ids: Market IDs to fetch
             
-        try:
-            # Get market book with prices
-            price_projection = filters.price_projection(
-                price_data=['EX_BEST_OFFERS', 'EX_TRADED'],
-                ex_best_offers_overrides=filters.ex_best_offers_overrides(
-                    best_prices_depth=3
+        Returns:
+            Dictionary mapping market ID to its runners' PriceData. Markets
+            that could not be fetched are missing.
+        """
+        if not self.is_authenticated:
+            return {}
+        
+        parse_runner = self._parse_message
+        prices = {}
+        
+        batch_size = self.MARKET_BOOK_BATCH_SIZE
+        for i in range(0, len(market_ids), batch_size):
+            batch_ids = market_ids[i:i + batch_size]
+            try:
+                market_books = self.client.betting.list_market_book(
+                    market_ids=batch_ids,
+                    price_projection=self.PRICE_PROJECTION
                 )
-            )
-            
-            market_books = self.client.betting.list_market_book(
-                market_ids=[market_id],
-                price_projection=price_projection
-            )
-            
-            if not market_books:
-                return None
-                
-            market_book = market_books[0]
-            price_data_list = []
+            except BetfairError as e:
+                self.logger.error(f"Error getting market prices for {batch_ids}: {e}")
+                continue
             
             # Handle dict format due to lightweight=True
-            runners = market_book.get('runners', [])
-            
-            for runner in runners:
-                # Extract best back and lay prices
-                back_prices = []
-                lay_prices = []
-                
-                ex = runner.get('ex', {})
-                
-                if ex.get('availableToBack'):
-                    for price_size in ex['availableToBack']:
-                        back_prices.append({
-                            "price": price_size.get('price', 0),
-                            "size": price_size.get('size', 0)
-                        })
-                        
-                if ex.get('availableToLay'):
-                    for price_size in ex['availableToLay']:
-                        lay_prices.append({
-                            "price": price_size.get('price', 0),
-                            "size": price_size.get('size', 0)
-                        })
-                
-                price_data = PriceData(
-                    selection_id=str(runner.get('selectionId')),
-                    selection_name=str(runner.get('selectionId')),  # Name not available in lightweight mode
-                    back_prices=back_prices,
-                    lay_prices=lay_prices,
-                    last_price_traded=runner.get('lastPriceTraded'),
-                    total_matched=runner.get('totalMatched')
-                )
-                price_data_list.append(price_data)
-                
-                # Call callback if subscribed
-                if self._price_callback and market_id in self._price_subscriptions:
-                    self._price_callback(market_id, price_data)
-                    
-            return price_data_list
-            
-        except BetfairError as e:
-            self.logger.error(f"Error getting market prices: {e}")
-            return None
+            for market_book in market_books or []:
+                prices[market_book.get('marketId')] = [
+                    parse_runner(runner) for runner in market_book.get('runners', [])
+                ]
+        
+        return prices
     
     def get_match_scores(self, match_id: str) -> Optional[Score]:
         """
@@ -338,10 +487,7 @@ class BetfairProvider(BaseDataProvider):
             # Get market book with full price data
             market_books = self.client.betting.list_market_book(
                 market_ids=[market_id],
-                price_projection={
-                    'priceData': ['EX_BEST_OFFERS', 'EX_TRADED'],
-                    'virtualise': True
-                }
+                price_projection=self.MARKET_BOOK_PROJECTION
             )
             
             # Return first market book (we only requested one)
@@ -403,10 +549,31 @@ class BetfairProvider(BaseDataProvider):
         """Place a lay bet on Betfair."""
         return self._place_bet(market_id, selection_id, "LAY", price, size, **kwargs)
     
-    def _place_bet(
+    async def aplace_back_bet(
+        self,
+        market_id: str,
+        selection_id: str,
+        price: float,
+        size: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Place a back bet, batched with other bets placed in the same burst."""
+        return await self._queue_place(market_id, selection_id, "BACK", price, size, **kwargs)
+    
+    async def aplace_lay_bet(
         self,
         market_id: str,
         selection_id: str,
+        price: float,
+        size: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Place a lay bet, batched with other bets placed in the same burst."""
+        return await self._queue_place(market_id, selection_id, "LAY", price, size, **kwargs)
+    
+    def _build_place_instruction(
+        self,
+        selection_id: str,
         side: str,
         price: float,
         size: float,
@@ -418,38 +585,84 @@ class BetfairProvider(BaseDataProvider):
         bet_target_size: Optional[float] = None,
         customer_ref: Optional[str] = None,
         **kwargs
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Build a placeOrders instruction.
+        
+        Returns:
+            Tuple of (instruction, price in integer hundredths)
+        """
+        price_units = _to_units(price, _PRICE_SCALE)
+        size_units = _to_units(size, _SIZE_SCALE)
+        
+        # Create limit order
+        limit_order = {
+            "size": _from_units(size_units, _SIZE_SCALE),
+            "price": _from_units(price_units, _PRICE_SCALE),
+            "persistenceType": persistence_type
+        }
+        
+        # Add optional parameters
+        if time_in_force:
+            limit_order["timeInForce"] = time_in_force
+        if min_fill_size:
+            limit_order["minFillSize"] = min_fill_size
+        if bet_target_type and bet_target_size:
+            limit_order["betTargetType"] = bet_target_type
+            limit_order["betTargetSize"] = bet_target_size
+        
+        # Create place instruction
+        place_instruction = {
+            "orderType": order_type,
+            "selectionId": selection_id,
+            "side": side,
+            "limitOrder": limit_order
+        }
+        
+        if customer_ref:
+            place_instruction["customerOrderRef"] = customer_ref
+        
+        return place_instruction, price_units
+    
+    def _placed_result(
+        self,
+        report: Dict[str, Any],
+        market_id: str,
+        selection_id: str,
+        side: str,
+        price_units: int
+    ) -> Dict[str, Any]:
+        """Record a successful instruction report and convert it to a result."""
+        self._remember_bet(report.get('betId'), market_id, selection_id, side, price_units)
+        return {
+            "success": True,
+            "bet_id": report.get('betId'),
+            "placed_date": report.get('placedDate'),
+            "average_price_matched": report.get('averagePriceMatched', 0),
+            "size_matched": report.get('sizeMatched', 0),
+            "status": report.get('status'),
+            "order_status": report.get('orderStatus'),
+            "instruction": report
+        }
+    
+    def _place_bet(
+        self,
+        market_id: str,
+        selection_id: str,
+        side: str,
+        price: float,
+        size: float,
+        customer_ref: Optional[str] = None,
+        **kwargs
     ) -> Dict[str, Any]:
         """Internal method to place a bet on Betfair."""
         if not self.is_authenticated:
             return {"success": False, "error": "Not authenticated"}
             
         try:
-            # Create limit order
-            limit_order = {
-                "size": size,
-                "price": price,
-                "persistenceType": persistence_type
-            }
-            
-            # Add optional parameters
-            if time_in_force:
-                limit_order["timeInForce"] = time_in_force
-            if min_fill_size:
-                limit_order["minFillSize"] = min_fill_size
-            if bet_target_type and bet_target_size:
-                limit_order["betTargetType"] = bet_target_type
-                limit_order["betTargetSize"] = bet_target_size
-            
-            # Create place instruction
-            place_instruction = {
-                "orderType": order_type,
-                "selectionId": selection_id,
-                "side": side,
-                "limitOrder": limit_order
-            }
-            
-            if customer_ref:
-                place_instruction["customerOrderRef"] = customer_ref
+            place_instruction, price_units = self._build_place_instruction(
+                selection_id, side, price, size, customer_ref=customer_ref, **kwargs
+            )
             
             # Place the bet
             result = self.client.betting.place_orders(
@@ -464,17 +677,9 @@ class BetfairProvider(BaseDataProvider):
                 if status == "SUCCESS":
                     instruction_reports = result.get('instructionReports', [])
                     if instruction_reports:
-                        report = instruction_reports[0]
-                        return {
-                            "success": True,
-                            "bet_id": report.get('betId'),
-                            "placed_date": report.get('placedDate'),
-                            "average_price_matched": report.get('averagePriceMatched', 0),
-                            "size_matched": report.get('sizeMatched', 0),
-                            "status": report.get('status'),
-                            "order_status": report.get('orderStatus'),
-                            "instruction": report
-                        }
+                        return self._placed_result(
+                            instruction_reports[0], market_id, selection_id, side, price_units
+                        )
                 else:
                     return {
                         "success": False,
@@ -485,6 +690,7 @@ class BetfairProvider(BaseDataProvider):
                 # Handle object format
                 if result.status == "SUCCESS":
                     instruction_report = result.instruction_reports[0]
+                    self._remember_bet(instruction_report.bet_id, market_id, selection_id, side, price_units)
                     return {
                         "success": True,
                         "bet_id": instruction_report.bet_id,
@@ -504,23 +710,140 @@ class BetfairProvider(BaseDataProvider):
             self.logger.error(f"Error placing bet: {e}")
             return {"success": False, "error": str(e)}
     
+    async def _queue_place(
+        self,
+        market_id: str,
+        selection_id: str,
+        side: str,
+        price: float,
+        size: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Queue a bet and wait for the batched placeOrders call that sends it."""
+        if not self.is_authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        
+        try:
+            instruction, price_units = self._build_place_instruction(
+                selection_id, side, price, size, **kwargs
+            )
+        except Exception as e:
+            self.logger.error(f"Error placing bet: {e}")
+            return {"success": False, "error": str(e)}
+        
+        loop = asyncio.get_running_loop()
+        if self._flush_task is not None and (
+            self._flush_loop is not loop or self._flush_task.cancelled()
+        ):
+            # The timer belongs to a loop that stopped before it fired
+            self._drop_stale_places(loop)
+        
+        future = loop.create_future()
+        self._pending_places.append((market_id, instruction, price_units, future))
+        
+        if self._flush_task is None:
+            self._flush_task = loop.call_later(self.PLACE_BATCH_DELAY, self._flush_places)
+            self._flush_loop = loop
+        
+        return await future
+    
+    def _drop_stale_places(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Discard the flush timer and fail queued bets from any other loop."""
+        self._flush_task.cancel()
+        self._flush_task = self._flush_loop = None
+        
+        pending, self._pending_places = self._pending_places, []
+        for entry in pending:
+            future = entry[3]
+            if future.get_loop() is loop:
+                self._pending_places.append(entry)
+            elif not future.done():
+                try:
+                    future.set_result({"success": False, "error": "Event loop stopped before the bet was sent"})
+                except RuntimeError:
+                    # Its loop is closed; nothing is left to wake
+                    pass
+    
+    def _flush_places(self) -> None:
+        """Send queued instructions, one placeOrders call per market and 200 instructions."""
+        pending, self._pending_places = self._pending_places, []
+        self._flush_task = self._flush_loop = None
+        
+        by_market: Dict[str, List[Tuple[str, Dict[str, Any], int, asyncio.Future]]] = {}
+        for entry in pending:
+            by_market.setdefault(entry[0], []).append(entry)
+        
+        loop = asyncio.get_running_loop()
+        for market_id, entries in by_market.items():
+            for start in range(0, len(entries), self.PLACE_BATCH_MAX):
+                task = loop.create_task(
+                    self._send_places(market_id, entries[start:start + self.PLACE_BATCH_MAX])
+                )
+                self._place_tasks.add(task)
+                task.add_done_callback(self._place_tasks.discard)
+    
+    async def _send_places(
+        self,
+        market_id: str,
+        entries: List[Tuple[str, Dict[str, Any], int, asyncio.Future]]
+    ) -> None:
+        """Place a batch of instructions and resolve each caller's future.
+        
+        Every future is resolved on return, whatever fails along the way.
+        """
+        error = "Bet placement did not complete"
+        try:
+            result = await asyncio.to_thread(
+                self.client.betting.place_orders,
+                market_id=market_id,
+                instructions=[instruction for _, instruction, _, _ in entries]
+            )
+            
+            # Reports are returned in instruction order
+            reports = result.get('instructionReports') or []
+            for i, (_, instruction, price_units, future) in enumerate(entries):
+                if future.done():
+                    continue
+                report = reports[i] if i < len(reports) else {}
+                status = report.get('status') or result.get('status')
+                if status == "SUCCESS":
+                    future.set_result(self._placed_result(
+                        report, market_id, instruction["selectionId"], instruction["side"], price_units
+                    ))
+                else:
+                    future.set_result({
+                        "success": False,
+                        "error": report.get('errorCode') or result.get('errorCode', 'Unknown error'),
+                        "status": status
+                    })
+        except Exception as e:
+            self.logger.error(f"Error placing {len(entries)} bets on {market_id}: {e}")
+            error = str(e)
+        finally:
+            for *_, future in entries:
+                if not future.done():
+                    future.set_result({"success": False, "error": error})
+    
     def cancel_bet(self, bet_id: str, size_reduction: Optional[float] = None) -> bool:
         """Cancel or reduce a bet."""
         if not self.is_authenticated:
             return False
             
         try:
-            # First, get the market ID for this bet
-            current_orders = self.client.betting.list_current_orders(
-                bet_ids=[bet_id]
-            )
+            # Get the market ID for this bet, from the cache if we placed it
+            meta = self._lookup_bet(bet_id)
+            market_id = meta[0] if meta else None
             
-            # Extract market_id from the order
-            market_id = None
-            if isinstance(current_orders, dict):
-                orders = current_orders.get('currentOrders', [])
-                if orders:
-                    market_id = orders[0].get('marketId')
+            if not market_id:
+                current_orders = self.client.betting.list_current_orders(
+                    bet_ids=[bet_id]
+                )
+                
+                # Extract market_id from the order
+                if isinstance(current_orders, dict):
+                    orders = current_orders.get('currentOrders', [])
+                    if orders:
+                        market_id = orders[0].get('marketId')
             
             # Create cancel instruction
             instruction = {"betId": bet_id}
@@ -541,6 +864,8 @@ class BetfairProvider(BaseDataProvider):
                     # Check instruction reports
                     reports = result.get('instructionReports', [])
                     if reports and reports[0].get('status') == 'SUCCESS':
+                        if not size_reduction:
+                            self._forget_bet(bet_id)
                         return True
                     else:
                         self.logger.error(f"Cancel failed: {reports[0] if reports else 'No report'}")
@@ -571,33 +896,42 @@ class BetfairProvider(BaseDataProvider):
             # 2. Cancel the old bet
             # 3. Place a new bet with updated parameters
             
-            # Get current order details
-            current_orders = self.client.betting.list_current_orders(
-                bet_ids=[bet_id]
-            )
+            # Get current order details. Bets placed here are cached; the
+            # remaining size changes as the bet matches, so it is always
+            # fetched when no new size is given
+            meta = self._lookup_bet(bet_id)
             
-            if isinstance(current_orders, dict):
-                orders = current_orders.get('currentOrders', [])
+            if meta and new_size:
+                market_id, selection_id, side, cached_price = meta
+                price = new_price if new_price else _from_units(cached_price, _PRICE_SCALE)
+                size = new_size
             else:
-                orders = []
-            
-            if not orders:
-                return {"success": False, "error": "Bet not found"}
-            
-            order = orders[0]
+                current_orders = self.client.betting.list_current_orders(
+                    bet_ids=[bet_id]
+                )
+                
+                if isinstance(current_orders, dict):
+                    orders = current_orders.get('currentOrders', [])
+                else:
+                    orders = []
+                
+                if not orders:
+                    return {"success": False, "error": "Bet not found"}
+                
+                order = orders[0]
+                market_id = order.get('marketId')
+                selection_id = order.get('selectionId')
+                side = order.get('side')
+                
+                # Use new values or existing ones
+                price = new_price if new_price else order.get('priceSize', {}).get('price')
+                size = new_size if new_size else order.get('sizeRemaining')
             
             # Cancel existing bet
             if not self.cancel_bet(bet_id):
                 return {"success": False, "error": "Failed to cancel existing bet"}
             
             # Place new bet with updated parameters
-            market_id = order.get('marketId')
-            selection_id = order.get('selectionId')
-            side = order.get('side')
-            
-            # Use new values or existing ones
-            price = new_price if new_price else order.get('priceSize', {}).get('price')
-            size = new_size if new_size else order.get('sizeRemaining')
             
             # Place the replacement bet
             if side == "BACK":
@@ -609,6 +943,44 @@ class BetfairProvider(BaseDataProvider):
             self.logger.error(f"Error updating bet: {e}")
             return {"success": False, "error": str(e)}
     
+    def _remember_bet(
+        self,
+        bet_id: Optional[str],
+        market_id: str,
+        selection_id: str,
+        side: str,
+        price_units: int
+    ) -> None:
+        """Cache the identifying details of a placed bet."""
+        if not bet_id:
+            return
+        with self._bet_meta_lock:
+            self._bet_meta[bet_id] = (market_id, selection_id, side, price_units, time.monotonic())
+            self._bet_meta.move_to_end(bet_id)
+            while len(self._bet_meta) > self.BET_META_MAX_SIZE:
+                self._bet_meta.popitem(last=False)
+    
+    def _lookup_bet(self, bet_id: str) -> Optional[Tuple[str, str, str, int]]:
+        """
+        Get cached (market_id, selection_id, side, price units) for a bet.
+        
+        Returns:
+            Cached details, or None if unknown or expired
+        """
+        with self._bet_meta_lock:
+            meta = self._bet_meta.get(bet_id)
+            if not meta:
+                return None
+            if time.monotonic() - meta[4] > self.BET_META_TTL:
+                del self._bet_meta[bet_id]
+                return None
+            return meta[:4]
+    
+    def _forget_bet(self, bet_id: str) -> None:
+        """Drop a bet from the cache."""
+        with self._bet_meta_lock:
+            self._bet_meta.pop(bet_id, None)
+    
     def get_open_orders(self, market_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get list of open/unmatched orders."""
         if not self.is_authenticated:
@@ -650,46 +1022,105 @@ class BetfairProvider(BaseDataProvider):
             return []
     
     def get_matched_bets(self, market_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get list of matched bets."""
+        """
+        Get list of matched bets.
+        
+        Settled bets are cached per market filter, least recently used
+        filters evicted first. Each call only asks Betfair for bets
+        settled since the newest one already seen; after
+        CLEARED_CACHE_TTL a filter's rows are fetched again in full.
+        """
         if not self.is_authenticated:
             return []
         
         try:
             # Build filter
-            kwargs = {'order_projection': 'EXECUTABLE'}
+            kwargs = {}
             if market_id:
                 kwargs['market_ids'] = [market_id]
             
-            # Get cleared orders (matched bets)
-            cleared_orders = self.client.betting.list_cleared_orders(
-                bet_status='SETTLED',
-                **kwargs
-            )
-            
-            # Handle dict format
-            orders = cleared_orders.get('clearedOrders', []) if isinstance(cleared_orders, dict) else []
+            with self._cleared_lock:
+                entry = self._cleared_cache.get(market_id)
+            if entry and time.monotonic() - entry[2] <= self.CLEARED_CACHE_TTL:
+                cache, seen, fetched = dict(entry[0]), entry[1], entry[2]
+            else:
+                cache, seen, fetched = {}, None, time.monotonic()
+            
+            if seen:
+                kwargs['settled_date_range'] = filters.time_range(from_=seen)
+            
+            # Page through the new cleared orders (matched bets)
+            from_record = 0
+            while True:
+                cleared_orders = self.client.betting.list_cleared_orders(
+                    bet_status='SETTLED',
+                    from_record=from_record,
+                    **kwargs
+                )
+                
+                # Handle dict format
+                if not isinstance(cleared_orders, dict):
+                    break
+                orders = cleared_orders.get('clearedOrders', [])
+                
+                for order in orders:
+                    # The range start is inclusive, so rows at the watermark repeat
+                    cache[order.get('betId')] = {
+                        "bet_id": order.get('betId'),
+                        "market_id": order.get('marketId'),
+                        "selection_id": order.get('selectionId'),
+                        "price": order.get('priceMatched', 0),
+                        "size": order.get('sizeSettled', 0),
+                        "side": order.get('side'),
+                        "placed_date": order.get('placedDate'),
+                        "settled_date": order.get('settledDate'),
+                        "profit": order.get('profit', 0),
+                        "commission": order.get('commission', 0)
+                    }
+                    settled = order.get('settledDate')
+                    if settled and (not seen or settled > seen):
+                        seen = settled
+                
+                if not orders or not cleared_orders.get('moreAvailable'):
+                    break
+                from_record += len(orders)
             
-            matched_bets = []
-            for order in orders:
-                matched_bets.append({
-                    "bet_id": order.get('betId'),
-                    "market_id": order.get('marketId'),
-                    "selection_id": order.get('selectionId'),
-                    "price": order.get('priceMatched', 0),
-                    "size": order.get('sizeSettled', 0),
-                    "side": order.get('side'),
-                    "placed_date": order.get('placedDate'),
-                    "settled_date": order.get('settledDate'),
-                    "profit": order.get('profit', 0),
-                    "commission": order.get('commission', 0)
-                })
+            with self._cleared_lock:
+                self._cleared_cache[market_id] = (cache, seen, fetched)
+                self._cleared_cache.move_to_end(market_id)
+                while len(self._cleared_cache) > self.CLEARED_CACHE_MAX_SIZE:
+                    self._cleared_cache.popitem(last=False)
             
-            return matched_bets
+            return list(cache.values())
             
         except BetfairError as e:
             self.logger.error(f"Error getting matched bets: {e}")
             return []
     
+    async def snapshot(self, market_ids: List[str]) -> Dict[str, Any]:
+        """
+        Fetch balance, open orders and market prices concurrently.
+        
+        The three REST calls are independent, so they run in worker
+        threads at the same time instead of back to back.
+        
+        Args:
+            market_ids: Markets to fetch prices for
+            
+        Returns:
+            Dict with "balance", "open_orders" and "prices" (market ID -> PriceData list)
+        """
+        balance, open_orders, prices = await asyncio.gather(
+            asyncio.to_thread(self.get_account_balance),
+            asyncio.to_thread(self.get_open_orders),
+            asyncio.to_thread(self.get_market_prices_bulk, market_ids)
+        )
+        return {
+            "balance": balance,
+            "open_orders": open_orders,
+            "prices": prices
+        }
+    
     def get_open_bets(self) -> List[Dict[str, Any]]:
         """Get list of open bets."""
         if not self.is_authenticated:
@@ -724,6 +1155,17 @@ class BetfairProvider(BaseDataProvider):
             self.logger.error(f"Error getting open bets: {e}")
             return []
     
+    async def akeep_alive(self) -> bool:
+        """
+        Keep the session alive unless it was used recently.
+        
+        Betfair extends the session on every authenticated call, so a
+        keep-alive is only sent after KEEP_ALIVE_IDLE seconds without one.
+        """
+        if time.monotonic() - self.last_activity < self.KEEP_ALIVE_IDLE:
+            return True
+        return await super().akeep_alive()
+    
     def keep_alive(self) -> bool:
         """Keep the session alive."""
         if not self.is_authenticated:
@@ -758,11 +1200,6 @@ class BetfairProvider(BaseDataProvider):
             if self.stream_client:
                 self.stream_client.disconnect()
                 
-            # Stop keep-alive thread
-            self._stop_keep_alive.set()
-            if self._keep_alive_thread:
-                self._keep_alive_thread.join(timeout=5)
-                
             # Logout from Betfair
             if self.is_authenticated:
                 self.client.logout()
@@ -789,22 +1226,24 @@ class BetfairProvider(BaseDataProvider):
             return False
             
         try:
-            # Create stream client if not exists
-            if not self.stream_client:
-                self.stream_client = BetfairStreamClient(
-                    session_token=self.session_token,
-                    app_key=self.app_key,
-                    cert_file=self.cert_file,
-                    logger=self.logger
-                )
-            
             # Connect to stream
-            return self.stream_client.connect(config)
+            return self._get_stream_client().connect(config)
             
         except Exception as e:
             self.logger.error(f"Failed to connect stream: {e}")
             return False
     
+    def _get_stream_client(self) -> BetfairStreamClient:
+        """Get the stream client, creating it if it does not exist."""
+        if not self.stream_client:
+            self.stream_client = BetfairStreamClient(
+                session_token=self.session_token,
+                app_key=self.app_key,
+                cert_file=self.cert_file,
+                logger=self.logger
+            )
+        return self.stream_client
+    
     def disconnect_stream(self) -> bool:
         """Disconnect from streaming service."""
         if self.stream_client:
@@ -840,7 +1279,7 @@ class BetfairProvider(BaseDataProvider):
         
         return self.stream_client.subscribe_markets(
             market_ids=market_ids,
-            callback=callback,
+            callback=self._dispatch_stream_message,
             fields=fields,
             conflate_ms=conflate_ms
         )
@@ -851,20 +1290,66 @@ class BetfairProvider(BaseDataProvider):
             return self.stream_client.unsubscribe_markets(market_ids)
         return False
     
-    def handle_stream_message(self, message: Any) -> Optional[StreamMessage]:
+    def handle_stream_message(
+        self,
+        message: Union[bytes, bytearray, memoryview, str, StreamMessage]
+    ) -> Optional[StreamMessage]:
         """
-        Handle a stream message (already handled by BetfairStreamClient).
+        Handle a stream message.
+        
+        Raw frames are parsed straight from the wire bytes with orjson.
+        Messages from BetfairStreamClient are already normalized and are
+        passed through.
         
         Args:
-            message: Raw message from stream
+            message: Raw frame (bytes, memoryview or str) or StreamMessage
             
         Returns:
-            StreamMessage or None
+            StreamMessage or None. A market change frame carrying several
+            markets gives one message with a list of MarketPrices in data.
         """
-        # BetfairStreamClient already handles and normalizes messages
-        # This is here for API compliance
         if isinstance(message, StreamMessage):
             return message
+        if not isinstance(message, (bytes, bytearray, memoryview, str)):
+            return None
+        
+        try:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse stream message: {e}")
+            return None
+        
+        if not isinstance(data, dict):
+            return None
+        
+        op = data.get("op")
+        
+        if op == "heartbeat":
+            return StreamMessage.heartbeat_message("betfair")
+        
+        if op == "mcm":
+            # Use the client's cached definitions for names when connected
+            parse = self.stream_client.parse_market_prices if self.stream_client else parse_market_change
+            updates = []
+            for market_change in data.get("mc", []):
+                market_prices = parse(market_change)
+                if market_prices:
+                    updates.append((market_prices, market_change))
+            
+            if len(updates) == 1:
+                market_prices, market_change = updates[0]
+                return StreamMessage.market_change_message(
+                    "betfair",
+                    market_prices,
+                    raw=market_change
+                )
+            if updates:
+                return StreamMessage.market_change_batch(
+                    "betfair",
+                    [market_prices for market_prices, _ in updates],
+                    raw=[market_change for _, market_change in updates]
+                )
+        
         return None
     
     def get_stream_status(self) -> StreamStatus:
@@ -875,12 +1360,17 @@ class BetfairProvider(BaseDataProvider):
     
     # ============== Tennis Score/Stats Methods ==============
     
-    def get_tennis_matches(self, status: Optional[str] = None) -> List[TennisMatch]:
+    def get_tennis_matches(
+        self,
+        status: Optional[str] = None,
+        include_traded: bool = False
+    ) -> List[TennisMatch]:
         """
         Get tennis matches with normalized data.
         
         Args:
             status: Filter by status (live, upcoming, completed)
+            include_traded: Also fetch traded volumes (many more price requests)
             
         Returns:
             List of normalized TennisMatch objects
@@ -915,29 +1405,36 @@ class BetfairProvider(BaseDataProvider):
             # Get market IDs for price fetching
             market_ids = [market.get('marketId') for market in markets if market.get('marketId')]
             
-            # Fetch prices for all markets in batches (max 5 per request to avoid TOO_MUCH_DATA error)
+            # Fetch prices for all markets in batches small enough to avoid the
+            # TOO_MUCH_DATA error, with the batches' round-trips overlapping
             market_prices = {}
-            batch_size = 5
-            for i in range(0, len(market_ids), batch_size):
-                batch_ids = market_ids[i:i+batch_size]
-                try:
-                    # Get market book with price data
-                    market_books = self.client.betting.list_market_book(
-                        market_ids=batch_ids,
-                        price_projection={
-                            'priceData': ['EX_BEST_OFFERS', 'EX_TRADED'],
-                            'virtualise': True
-                        }
-                    )
-                    
-                    # Store prices by market ID
-                    for book in market_books:
-                        market_id = book.get('marketId')
-                        if market_id:
-                            market_prices[market_id] = book
-                            
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch prices for batch {i//batch_size}: {e}")
+            if include_traded:
+                projection, batch_size = self.MARKET_BOOK_PROJECTION, 5
+            else:
+                projection, batch_size = self.MATCH_BOOK_PROJECTION, self.MATCH_BOOK_BATCH_SIZE
+            batches = [market_ids[i:i+batch_size] for i in range(0, len(market_ids), batch_size)]
+            if batches:
+                with ThreadPoolExecutor(max_workers=min(self.PRICE_FETCH_WORKERS, len(batches))) as executor:
+                    futures = {
+                        executor.submit(
+                            self.client.betting.list_market_book,
+                            market_ids=batch_ids,
+                            price_projection=projection
+                        ): index
+                        for index, batch_ids in enumerate(batches)
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            market_books = future.result()
+                        except Exception as e:
+                            self.logger.warning(f"Failed to fetch prices for batch {futures[future]}: {e}")
+                            continue
+                        
+                        # Store prices by market ID
+                        for book in market_books:
+                            market_id = book.get('marketId')
+                            if market_id:
+                                market_prices[market_id] = book
             
             # Normalize to TennisMatch objects with price data
             tennis_matches = []
@@ -983,7 +1480,7 @@ class BetfairProvider(BaseDataProvider):
             # For demo purposes, create a mock score based on market odds
             market_books = self.client.betting.list_market_book(
                 market_ids=[match_id.replace("betfair_", "")],
-                price_projection=filters.price_projection(price_data=["EX_BEST_OFFERS"])
+                price_projection=self.BEST_OFFERS_PROJECTION
             )
             
             if market_books:
@@ -1001,13 +1498,13 @@ class BetfairProvider(BaseDataProvider):
                     market = markets[0]
                     runners = market.get("runners", [])
                     
-                    player1 = Player(
-                        id=str(runners[0].get("selectionId")) if runners else "1",
-                        name=runners[0].get("runnerName", "Player 1") if runners else "Player 1"
+                    player1 = Player.get(
+                        intern_runner_id(runners[0].get("selectionId")) if runners else "1",
+                        runners[0].get("runnerName", "Player 1") if runners else "Player 1"
                     )
-                    player2 = Player(
-                        id=str(runners[1].get("selectionId")) if runners else "2",
-                        name=runners[1].get("runnerName", "Player 2") if len(runners) > 1 else "Player 2"
+                    player2 = Player.get(
+                        intern_runner_id(runners[1].get("selectionId")) if runners else "2",
+                        runners[1].get("runnerName", "Player 2") if len(runners) > 1 else "Player 2"
                     )
                     
                     # Create basic score structure
@@ -1,14 +1,18 @@
 """Betfair Stream API client implementation."""
 
 import ssl
+import sys
 import socket
-import json
+import queue
 import threading
 import time
 import logging
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from functools import lru_cache
+
+import orjson
 
 from .models import (
     StreamMessage, 
@@ -21,12 +25,100 @@ from .models import (
 )
 
 
+@lru_cache(maxsize=16384)
+def intern_runner_id(selection_id: Any) -> str:
+    """
+    Get the shared string form of a selection id.
+    
+    Selection ids repeat on every frame, so one string is kept per id.
+    The cache is bounded (least recently used first out) and sized for a
+    full market cache of runners.
+    
+    Args:
+        selection_id: Selection id as received (usually an int)
+        
+    Returns:
+        Interned string id
+    """
+    return sys.intern(str(selection_id))
+
+
+def parse_market_change(market_change: Dict, market_info: Optional[Dict] = None) -> Optional[MarketPrices]:
+    """
+    Parse one market change from an mcm frame into MarketPrices.
+    
+    Needs no connection; names come from market_info when given, the
+    cached definition of the market as kept by BetfairStreamClient.
+    
+    Args:
+        market_change: One entry of an mcm frame's mc list
+        market_info: Optional cached market definition
+        
+    Returns:
+        MarketPrices, or None if the change has no market id
+    """
+    market_id = market_change.get("id")
+    if not market_id:
+        return None
+    
+    market_info = market_info or {}
+    runners_map = market_info.get("runners") or {}
+    
+    market_prices = MarketPrices(
+        market_id=market_id,
+        market_name=market_info.get("name"),
+        event_name=market_info.get("eventName"),
+        in_play=market_info.get("inPlay", False),
+        total_matched=market_change.get("tv")  # Total volume
+    )
+    
+    # Parse runner changes
+    for runner_change in market_change.get("rc", []):
+        runner_id = intern_runner_id(runner_change.get("id"))
+        
+        market_prices.runners.append(RunnerPrices(
+            runner_id=runner_id,
+            runner_name=runners_map.get(runner_id) or f"Runner {runner_id}",
+            # Available to back / lay ladders
+            back_prices=[
+                PriceVolume(price_vol[0], price_vol[1])
+                for price_vol in runner_change.get("atb", ()) if len(price_vol) >= 2
+            ],
+            lay_prices=[
+                PriceVolume(price_vol[0], price_vol[1])
+                for price_vol in runner_change.get("atl", ()) if len(price_vol) >= 2
+            ],
+            last_traded_price=runner_change.get("ltp"),
+            total_matched=runner_change.get("tv")
+        ))
+    
+    return market_prices
+
+
 class BetfairStreamClient:
     """Client for Betfair Exchange Stream API."""
     
     STREAM_HOST = "stream-api.betfair.com"
     STREAM_PORT = 443
     
+    # Default fields for price data
+    DEFAULT_FIELDS = ("EX_BEST_OFFERS", "EX_TRADED", "EX_TRADED_VOL", "EX_LTP", "EX_MARKET_DEF")
+    
+    # Heartbeats only differ by id, so they are formatted straight to bytes
+    HEARTBEAT_TEMPLATE = b'{"op":"heartbeat","id":%d}\r\n'
+    
+    # Subscription changes within this window are sent as one op
+    SUBSCRIBE_DEBOUNCE = 0.025  # Seconds
+    
+    # Market definitions kept, least recently used evicted first
+    MARKET_CACHE_SIZE = 5000
+    
+    # Runner change keys that carry price data
+    RUNNER_PRICE_KEYS = frozenset(("atb", "atl", "ltp", "tv"))
+    
+    # Messages waiting for the callback on the dispatch thread
+    DISPATCH_QUEUE_SIZE = 1024
+    
     def __init__(
         self,
         session_token: str,
@@ -56,19 +148,44 @@ class BetfairStreamClient:
         
         # Threading
         self._read_thread = None
-        self._heartbeat_thread = None
+        self._coalesce_thread = None
+        self._dispatch_thread = None
         self._stop_threads = threading.Event()
+        self._send_lock = threading.Lock()  # Reader (heartbeats) and caller threads both write
         
         # Message handling
         self._message_id = 0
         self._callback = None
+        self._out_queue: "queue.Queue[StreamMessage]" = queue.Queue(maxsize=self.DISPATCH_QUEUE_SIZE)
         self._subscribed_markets = set()
-        self._market_cache = {}  # Cache for market data
+        
+        # Subscription changes waiting to be sent as one marketSubscription op
+        self._pending_sub_add = set()
+        self._pending_sub_remove = set()
+        self._sub_data_filter = {"fields": self.DEFAULT_FIELDS, "ladderLevels": 3}
+        self._sub_conflate_ms = None
+        self._sub_timer = None
+        self._sub_lock = threading.Lock()
+        self._market_cache: "OrderedDict[str, Dict]" = OrderedDict()  # Cache for market data
+        self._op_handlers = {
+            "mcm": self._handle_market_change,  # Market change message
+            "heartbeat": self._handle_heartbeat,
+            "status": self._handle_status_message,
+            "connection": self._handle_connection_message
+        }
+        
+        # Market updates held for the coalescing window, latest per market
+        self._pending_prices: Dict[str, Tuple[MarketPrices, Dict]] = {}
+        self._pending_lock = threading.Lock()
+        self._pending_event = threading.Event()
         
         # Reconnection
         self._reconnect_attempts = 0
         self._last_heartbeat = None
         
+        # Data read during the handshake, handed on to the reader thread
+        self._read_tail = b""
+        
     def connect(self, config: Optional[StreamConfig] = None) -> bool:
         """
         Connect to Betfair stream.
@@ -79,6 +196,47 @@ class BetfairStreamClient:
         Returns:
             bool: True if connection successful
         """
+        return self._open(config)
+    
+    def connect_and_subscribe(
+        self,
+        market_ids: List[str],
+        callback: Callable[[StreamMessage], None],
+        fields: Optional[List[str]] = None,
+        conflate_ms: Optional[int] = None,
+        ladder_levels: int = 3,
+        config: Optional[StreamConfig] = None
+    ) -> bool:
+        """
+        Connect to Betfair stream and subscribe to markets in one round-trip.
+        
+        The authentication and subscription ops are written together and
+        both replies are awaited at once.
+        
+        Args:
+            market_ids: List of market IDs
+            callback: Callback for stream messages. With coalescing on
+                (config.coalesce_ms) a market change message may carry a
+                list of MarketPrices in data, with market_id None
+            fields: Optional list of fields to include
+            conflate_ms: Optional conflation rate
+            ladder_levels: Depth of price ladder to stream
+            config: Optional stream configuration
+            
+        Returns:
+            bool: True if connection and subscription successful
+        """
+        self._callback = callback
+        
+        with self._sub_lock:
+            self._set_subscription_options(fields, conflate_ms, ladder_levels)
+            self._subscribed_markets = set(market_ids)
+            self._pending_sub_add.difference_update(market_ids)
+        
+        return self._open(config, subscribe=True)
+    
+    def _open(self, config: Optional[StreamConfig] = None, subscribe: bool = False) -> bool:
+        """Open, authenticate and (optionally) subscribe the stream connection."""
         if config:
             self.config = config
             
@@ -88,6 +246,8 @@ class BetfairStreamClient:
             
             # Create socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._enable_keepalive(self.socket)
             self.socket.settimeout(30)
             
             # SSL context with certificate
@@ -104,7 +264,7 @@ class BetfairStreamClient:
             self.ssl_socket.connect((self.STREAM_HOST, self.STREAM_PORT))
             
             # Authenticate
-            if not self._authenticate():
+            if not self._authenticate(subscribe):
                 self.disconnect()
                 return False
             
@@ -121,49 +281,113 @@ class BetfairStreamClient:
             self.status = StreamStatus.ERROR
             return False
     
-    def _authenticate(self) -> bool:
-        """Authenticate with the stream."""
+    @staticmethod
+    def _enable_keepalive(sock: socket.socket):
+        """Turn on TCP keepalive so a half-open connection errors out of recv."""
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        
+        # Probe after 15s idle, every 5s, give up after 3 misses (where supported)
+        for option, value in (("TCP_KEEPIDLE", 15), ("TCP_KEEPINTVL", 5), ("TCP_KEEPCNT", 3)):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+    
+    def _authenticate(self, subscribe: bool = False) -> bool:
+        """Authenticate with the stream, sending the market subscription with it if asked."""
         auth_message = {
             "op": "authentication",
             "id": self._get_next_id(),
             "appKey": self.app_key,
             "session": self.session_token
         }
+        messages = [auth_message]
         
-        self._send_message(auth_message)
-        
-        # Wait for authentication response
-        timeout = time.time() + 10
-        while time.time() < timeout:
-            response = self._read_message()
-            if response:
-                if response.get("op") == "status":
-                    if response.get("statusCode") == "SUCCESS":
-                        self.logger.info("Stream authentication successful")
-                        return True
-                    else:
+        if subscribe:
+            with self._sub_lock:
+                messages.append(self._subscription_message(self._subscribed_markets))
+        
+        self._send_many(messages)
+        
+        if not self._await_status([message["id"] for message in messages]):
+            return False
+        
+        self.logger.info("Stream authentication successful")
+        return True
+    
+    def _await_status(self, message_ids: List[int], timeout: float = 10) -> bool:
+        """
+        Block until a successful status reply arrives for each message id.
+        
+        Other messages received meanwhile are processed as normal; any
+        partial message left over is handed to the reader thread.
+        
+        Args:
+            message_ids: Ids of the ops awaiting a reply
+            timeout: Seconds to wait for all replies
+            
+        Returns:
+            bool: True if every op succeeded
+        """
+        pending = set(message_ids)
+        buffer = b""
+        deadline = time.monotonic() + timeout
+        
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.logger.error("Stream authentication timeout")
+                return False
+            
+            self.ssl_socket.settimeout(remaining)
+            try:
+                data = self.ssl_socket.recv(self.config.buffer_size)
+            except socket.timeout:
+                continue
+            
+            if not data:
+                self.logger.error("Stream closed during authentication")
+                return False
+            
+            buffer += data
+            
+            while b'\r\n' in buffer:
+                line, buffer = buffer.split(b'\r\n', 1)
+                if not line:
+                    continue
+                
+                response = orjson.loads(line)
+                if pending and response.get("op") == "status" and response.get("id") in pending:
+                    if response.get("statusCode") != "SUCCESS":
                         self.logger.error(f"Stream authentication failed: {response}")
                         return False
-            time.sleep(0.1)
-            
-        self.logger.error("Stream authentication timeout")
-        return False
+                    pending.discard(response.get("id"))
+                else:
+                    self._process_message(line)
+        
+        self._read_tail = buffer
+        return True
     
     def subscribe_markets(
         self,
         market_ids: List[str],
         callback: Callable[[StreamMessage], None],
         fields: Optional[List[str]] = None,
-        conflate_ms: Optional[int] = None
+        conflate_ms: Optional[int] = None,
+        ladder_levels: int = 3
     ) -> bool:
         """
         Subscribe to market data.
         
+        Changes made within SUBSCRIBE_DEBOUNCE of each other are sent
+        together as a single subscription for the full set of markets.
+        
         Args:
             market_ids: List of market IDs
-            callback: Callback for stream messages
+            callback: Callback for stream messages. With coalescing on
+                (config.coalesce_ms) a market change message may carry a
+                list of MarketPrices in data, with market_id None
             fields: Optional list of fields to include
             conflate_ms: Optional conflation rate
+            ladder_levels: Depth of price ladder to stream
             
         Returns:
             bool: True if subscription successful
@@ -174,29 +398,11 @@ class BetfairStreamClient:
             
         self._callback = callback
         
-        # Default fields for price data
-        if fields is None:
-            fields = ["EX_BEST_OFFERS", "EX_TRADED", "EX_TRADED_VOL", "EX_LTP", "EX_MARKET_DEF"]
-        
-        subscription_message = {
-            "op": "marketSubscription",
-            "id": self._get_next_id(),
-            "marketFilter": {
-                "marketIds": market_ids
-            },
-            "marketDataFilter": {
-                "fields": fields,
-                "ladderLevels": 3
-            }
-        }
-        
-        if conflate_ms is not None:
-            subscription_message["conflateMs"] = conflate_ms
-        elif self.config.conflate_ms:
-            subscription_message["conflateMs"] = self.config.conflate_ms
-            
-        self._send_message(subscription_message)
-        self._subscribed_markets.update(market_ids)
+        with self._sub_lock:
+            self._set_subscription_options(fields, conflate_ms, ladder_levels)
+            self._pending_sub_add.update(market_ids)
+            self._pending_sub_remove.difference_update(market_ids)
+            self._schedule_subscription_flush()
         
         self.logger.info(f"Subscribed to markets: {market_ids}")
         return True
@@ -205,21 +411,90 @@ class BetfairStreamClient:
         """Unsubscribe from markets."""
         if not self.is_connected():
             return False
+        
+        with self._sub_lock:
+            self._pending_sub_remove.update(market_ids)
+            self._pending_sub_add.difference_update(market_ids)
+            self._schedule_subscription_flush()
+        
+        self.logger.info(f"Unsubscribed from markets: {market_ids}")
+        return True
+    
+    def _schedule_subscription_flush(self):
+        """Start the debounce timer if one is not already running (call with _sub_lock held)."""
+        if self._sub_timer is None:
+            self._sub_timer = threading.Timer(self.SUBSCRIBE_DEBOUNCE, self._flush_subscriptions)
+            self._sub_timer.daemon = True
+            self._sub_timer.start()
+    
+    def _flush_subscriptions(self):
+        """Send pending subscription changes as one marketSubscription op."""
+        with self._sub_lock:
+            self._sub_timer = None
+            
+            # Leave changes pending; reconnecting schedules another flush
+            if not self.is_connected():
+                return
+            
+            removed = self._pending_sub_remove
+            markets = (self._subscribed_markets | self._pending_sub_add) - removed
+            self._pending_sub_add = set()
+            self._pending_sub_remove = set()
+            
+            if markets:
+                # A subscription replaces the previous one, so it always
+                # carries every market we want
+                message = self._subscription_message(markets)
+            elif removed:
+                message = {
+                    "op": "marketSubscription",
+                    "id": self._get_next_id(),
+                    "marketFilter": {
+                        "marketIds": list(removed)
+                    },
+                    "marketDataFilter": {}
+                }
+            else:
+                return
             
-        unsubscribe_message = {
+            self._subscribed_markets = markets
+            
+            try:
+                self._send_message(message)
+            except Exception as e:
+                self.logger.error(f"Failed to send subscription: {e}")
+    
+    def _set_subscription_options(
+        self,
+        fields: Optional[List[str]],
+        conflate_ms: Optional[int],
+        ladder_levels: int
+    ):
+        """Store the options used by every subscription op (call with _sub_lock held)."""
+        # Built once here and shared by every op, including resubscriptions
+        self._sub_data_filter = {
+            "fields": self.DEFAULT_FIELDS if fields is None else fields,
+            "ladderLevels": ladder_levels
+        }
+        self._sub_conflate_ms = conflate_ms
+    
+    def _subscription_message(self, market_ids) -> Dict:
+        """Build a marketSubscription op from the current subscription options."""
+        subscription_message = {
             "op": "marketSubscription",
             "id": self._get_next_id(),
             "marketFilter": {
-                "marketIds": market_ids
+                "marketIds": list(market_ids)
             },
-            "marketDataFilter": {}
+            "marketDataFilter": self._sub_data_filter
         }
         
-        self._send_message(unsubscribe_message)
-        self._subscribed_markets.difference_update(market_ids)
+        if self._sub_conflate_ms is not None:
+            subscription_message["conflateMs"] = self._sub_conflate_ms
+        elif self.config.conflate_ms:
+            subscription_message["conflateMs"] = self.config.conflate_ms
         
-        self.logger.info(f"Unsubscribed from markets: {market_ids}")
-        return True
+        return subscription_message
     
     def disconnect(self) -> bool:
         """Disconnect from stream."""
@@ -227,6 +502,11 @@ class BetfairStreamClient:
             self.status = StreamStatus.DISCONNECTED
             self._stop_threads.set()
             
+            with self._sub_lock:
+                if self._sub_timer:
+                    self._sub_timer.cancel()
+                    self._sub_timer = None
+            
             if self.ssl_socket:
                 self.ssl_socket.close()
             if self.socket:
@@ -240,40 +520,80 @@ class BetfairStreamClient:
             return False
     
     def _start_threads(self):
-        """Start reader and heartbeat threads."""
+        """Start reader, dispatch and (if enabled) coalescing threads."""
         self._stop_threads.clear()
         
+        # Reads time out at the heartbeat interval so the reader thread
+        # can also send heartbeats
+        self.ssl_socket.settimeout(self.config.heartbeat_ms / 1000)
+        
         # Start reader thread
         self._read_thread = threading.Thread(target=self._read_loop)
         self._read_thread.daemon = True
         self._read_thread.start()
         
-        # Start heartbeat thread
-        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop)
-        self._heartbeat_thread.daemon = True
-        self._heartbeat_thread.start()
+        # Start dispatch thread (a reconnect from the reader reuses it)
+        if not (self._dispatch_thread and self._dispatch_thread.is_alive()):
+            self._dispatch_thread = threading.Thread(target=self._dispatch_loop)
+            self._dispatch_thread.daemon = True
+            self._dispatch_thread.start()
+        
+        # Start coalescing thread
+        if self.config.coalesce_ms and not (self._coalesce_thread and self._coalesce_thread.is_alive()):
+            self._coalesce_thread = threading.Thread(target=self._coalesce_loop)
+            self._coalesce_thread.daemon = True
+            self._coalesce_thread.start()
     
     def _read_loop(self):
         """Main read loop for stream messages."""
-        buffer = ""
+        # Reads land directly in a reusable buffer; complete messages are
+        # parsed from it and any partial tail is moved to the front
+        tail, self._read_tail = self._read_tail, b""
+        buffer = bytearray(max(self.config.buffer_size, 2 * len(tail)))
+        buffer[:len(tail)] = tail
+        view = memoryview(buffer)
+        end = len(tail)  # Bytes of unprocessed data in the buffer
+        scan = 0  # Offset to resume the delimiter search from
+        next_heartbeat = 0.0
         
         while not self._stop_threads.is_set():
             try:
-                # Read data from socket
-                data = self.ssl_socket.recv(self.config.buffer_size).decode('utf-8')
+                # Send heartbeat when due
+                now = time.monotonic()
+                if now >= next_heartbeat:
+                    if not self._heartbeat():
+                        break
+                    next_heartbeat = now + self.config.heartbeat_ms / 1000
+                
+                # Grow the buffer if a single message has filled it
+                if end == len(buffer):
+                    view.release()
+                    buffer += bytes(len(buffer))
+                    view = memoryview(buffer)
+                
+                # Read data from socket (kept as bytes, orjson parses them directly)
+                received = self.ssl_socket.recv_into(view[end:])
                 
-                if not data:
+                if not received:
                     self.logger.warning("Stream closed by server")
                     self._handle_disconnect()
                     break
                 
-                buffer += data
+                end += received
                 
                 # Process complete messages (delimited by \r\n)
-                while '\r\n' in buffer:
-                    message, buffer = buffer.split('\r\n', 1)
-                    if message:
-                        self._process_message(message)
+                start = 0
+                idx = buffer.find(b'\r\n', scan, end)
+                while idx != -1:
+                    if idx > start:
+                        self._process_message(bytes(view[start:idx]))
+                    start = idx + 2
+                    idx = buffer.find(b'\r\n', start, end)
+                
+                if start:
+                    buffer[:end - start] = view[start:end]
+                    end -= start
+                scan = max(end - 1, 0)
                         
             except socket.timeout:
                 continue
@@ -282,64 +602,141 @@ class BetfairStreamClient:
                 self._handle_disconnect()
                 break
     
-    def _heartbeat_loop(self):
-        """Send periodic heartbeats."""
+    def _heartbeat(self) -> bool:
+        """
+        Send a heartbeat and check the server is still responding.
+        
+        Returns:
+            bool: False if heartbeats have timed out
+        """
+        self._send_heartbeat()
+        
+        # Check for missed heartbeats
+        if self._last_heartbeat:
+            time_since_heartbeat = time.time() - self._last_heartbeat
+            if time_since_heartbeat > 30:  # 30 seconds timeout
+                self.logger.warning("Heartbeat timeout")
+                self._handle_disconnect()
+                return False
+        
+        return True
+    
+    def _dispatch_loop(self):
+        """Deliver queued messages to the callback, off the reader thread."""
         while not self._stop_threads.is_set():
             try:
-                # Send heartbeat
-                self._send_heartbeat()
-                
-                # Check for missed heartbeats
-                if self._last_heartbeat:
-                    time_since_heartbeat = time.time() - self._last_heartbeat
-                    if time_since_heartbeat > 30:  # 30 seconds timeout
-                        self.logger.warning("Heartbeat timeout")
-                        self._handle_disconnect()
-                        break
+                message = self._out_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            
+            try:
+                if self._callback:
+                    self._callback(message)
+            except Exception as e:
+                self.logger.error(f"Callback error: {e}")
+            finally:
+                # Consumers have seen it; let the raw payload be freed
+                message.release_raw()
+    
+    def _emit(self, message: StreamMessage):
+        """
+        Queue a message for the callback.
+        
+        When the queue is full the oldest message is dropped if
+        config.drop_on_slow_consumer is set; otherwise this blocks.
+        """
+        try:
+            self._out_queue.put_nowait(message)
+        except queue.Full:
+            if not self.config.drop_on_slow_consumer:
+                self._out_queue.put(message)
+                return
+            
+            try:
+                self._out_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._out_queue.put_nowait(message)
+            except queue.Full:
+                self.logger.warning("Dispatch queue full, dropping stream message")
+    
+    def _coalesce_loop(self):
+        """Deliver coalesced market updates once per window."""
+        while not self._stop_threads.is_set():
+            try:
+                if not self._pending_event.wait(1.0):
+                    continue
                 
-                # Wait for next heartbeat interval
-                self._stop_threads.wait(self.config.heartbeat_ms / 1000)
+                # Let further updates for the same markets merge in
+                self._stop_threads.wait(self.config.coalesce_ms / 1000)
+                self._flush_pending_prices()
                 
             except Exception as e:
-                self.logger.error(f"Heartbeat error: {e}")
+                self.logger.error(f"Coalesce error: {e}")
+    
+    def _flush_pending_prices(self):
+        """
+        Send every pending market update to the callback.
+        
+        Updates go out in batches of up to config.batch_size markets so
+        the queue and callback are paid per batch, not per market.
+        """
+        with self._pending_lock:
+            pending, self._pending_prices = self._pending_prices, {}
+            self._pending_event.clear()
+        
+        if not self._callback or not pending:
+            return
+        
+        updates = list(pending.values())
+        batch_size = max(1, self.config.batch_size)
+        for i in range(0, len(updates), batch_size):
+            batch = updates[i:i + batch_size]
+            if len(batch) == 1:
+                market_prices, raw = batch[0]
+                self._emit(StreamMessage.market_change_message(
+                    "betfair",
+                    market_prices,
+                    raw=raw
+                ))
+            else:
+                self._emit(StreamMessage.market_change_batch(
+                    "betfair",
+                    [market_prices for market_prices, _ in batch],
+                    raw=[raw for _, raw in batch]
+                ))
     
     def _send_heartbeat(self):
         """Send heartbeat message."""
-        heartbeat = {
-            "op": "heartbeat",
-            "id": self._get_next_id()
-        }
-        self._send_message(heartbeat)
+        self._send_raw(self.HEARTBEAT_TEMPLATE % self._get_next_id())
     
-    def _process_message(self, message_str: str):
+    def _process_message(self, message_bytes: bytes):
         """Process a stream message."""
         try:
-            message = json.loads(message_str)
-            op = message.get("op")
-            
-            if op == "connection":
-                self._handle_connection_message(message)
-            elif op == "status":
-                self._handle_status_message(message)
-            elif op == "mcm":  # Market change message
-                self._handle_market_change(message)
-            elif op == "heartbeat":
-                self._last_heartbeat = time.time()
-                if self._callback:
-                    self._callback(StreamMessage.heartbeat_message("betfair"))
+            message = orjson.loads(message_bytes)
+            handler = self._op_handlers.get(message.get("op"))
+            if handler:
+                handler(message)
                     
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"Failed to parse message: {e}")
         except Exception as e:
             self.logger.error(f"Error processing message: {e}")
     
+    def _handle_heartbeat(self, message: Dict):
+        """Handle heartbeat message."""
+        self._last_heartbeat = time.time()
+        if self._callback:
+            self._emit(StreamMessage.heartbeat_message("betfair"))
+    
     def _handle_connection_message(self, message: Dict):
         """Handle connection message."""
         connection_id = message.get("connectionId")
         self.logger.info(f"Connection established: {connection_id}")
         
         if self._callback:
-            self._callback(StreamMessage.connection_message(
+            self._emit(StreamMessage.connection_message(
                 "betfair",
                 "connected",
                 connection_id=connection_id
@@ -353,7 +750,7 @@ class BetfairStreamClient:
         if status_code != "SUCCESS":
             self.logger.error(f"Status error: {status_code} - {error_message}")
             if self._callback:
-                self._callback(StreamMessage.error_message(
+                self._emit(StreamMessage.error_message(
                     "betfair",
                     error_message or status_code
                 ))
@@ -367,96 +764,133 @@ class BetfairStreamClient:
         
         for market_change in mc:
             market_id = market_change.get("id")
+            runner_changes = market_change.get("rc")
             
             # Update cache with market definition if present
             if "marketDefinition" in market_change:
                 self._update_market_definition(market_id, market_change["marketDefinition"])
+            elif not runner_changes or not any(
+                self.RUNNER_PRICE_KEYS.intersection(runner_change) for runner_change in runner_changes
+            ):
+                # Nothing to parse or deliver
+                continue
             
             # Parse price data
-            market_prices = self._parse_market_prices(market_change)
+            market_prices = self.parse_market_prices(market_change)
+            
+            if not market_prices:
+                continue
             
-            if market_prices:
+            if self.config.coalesce_ms:
+                self._queue_market_prices(market_prices, market_change)
+            else:
                 # Send normalized message
-                self._callback(StreamMessage.market_change_message(
+                self._emit(StreamMessage.market_change_message(
                     "betfair",
                     market_prices,
                     raw=market_change
                 ))
     
-    def _parse_market_prices(self, market_change: Dict) -> Optional[MarketPrices]:
-        """Parse market change into MarketPrices."""
+    def _queue_market_prices(self, market_prices: MarketPrices, raw: Dict):
+        """Hold a market update for the coalescing window."""
+        with self._pending_lock:
+            pending = self._pending_prices.get(market_prices.market_id)
+            if pending:
+                self._merge_market_prices(pending[0], market_prices)
+                market_prices = pending[0]
+            self._pending_prices[market_prices.market_id] = (market_prices, raw)
+        self._pending_event.set()
+    
+    @staticmethod
+    def _merge_market_prices(target: MarketPrices, update: MarketPrices):
+        """
+        Merge a later update for the same market into a pending one.
+        
+        Scalar fields are last-write-wins. A runner's ladder is replaced
+        only when the update carries one, since an absent ladder means
+        it did not change.
+        """
+        if update.market_name is not None:
+            target.market_name = update.market_name
+        if update.event_name is not None:
+            target.event_name = update.event_name
+        if update.total_matched is not None:
+            target.total_matched = update.total_matched
+        target.in_play = update.in_play
+        target.timestamp_ns = update.timestamp_ns
+        
+        for runner in update.runners:
+            current = target.get_runner(runner.runner_id)
+            if current is None:
+                target.runners.append(runner)
+                continue
+            
+            current.runner_name = runner.runner_name
+            if runner.back_prices:
+                current.back_prices = runner.back_prices
+            if runner.lay_prices:
+                current.lay_prices = runner.lay_prices
+            if runner.last_traded_price is not None:
+                current.last_traded_price = runner.last_traded_price
+            if runner.total_matched is not None:
+                current.total_matched = runner.total_matched
+    
+    def parse_market_prices(self, market_change: Dict) -> Optional[MarketPrices]:
+        """
+        Parse a market change into MarketPrices.
+        
+        Market and runner names come from the cached market definitions.
+        
+        Args:
+            market_change: One entry of an mcm frame's mc list
+            
+        Returns:
+            MarketPrices, or None if the change has no market id
+        """
         market_id = market_change.get("id")
         if not market_id:
             return None
-            
-        # Get cached market info
-        market_info = self._market_cache.get(market_id, {})
-        
-        market_prices = MarketPrices(
-            market_id=market_id,
-            market_name=market_info.get("name"),
-            event_name=market_info.get("eventName"),
-            in_play=market_info.get("inPlay", False),
-            total_matched=market_change.get("tv")  # Total volume
-        )
-        
-        # Parse runner changes
-        for runner_change in market_change.get("rc", []):
-            runner_id = str(runner_change.get("id"))
-            
-            runner_prices = RunnerPrices(
-                runner_id=runner_id,
-                runner_name=self._get_runner_name(market_id, runner_id),
-                last_traded_price=runner_change.get("ltp"),
-                total_matched=runner_change.get("tv")
-            )
-            
-            # Parse available to back
-            if "atb" in runner_change:
-                for price_vol in runner_change["atb"]:
-                    if len(price_vol) >= 2:
-                        runner_prices.back_prices.append(
-                            PriceVolume(price_vol[0], price_vol[1])
-                        )
-            
-            # Parse available to lay
-            if "atl" in runner_change:
-                for price_vol in runner_change["atl"]:
-                    if len(price_vol) >= 2:
-                        runner_prices.lay_prices.append(
-                            PriceVolume(price_vol[0], price_vol[1])
-                        )
-            
-            # Parse traded volumes
-            if "trd" in runner_change:
-                traded_volumes = runner_change["trd"]
-                # Could parse detailed traded volumes if needed
-            
-            market_prices.runners[runner_id] = runner_prices
-        
-        return market_prices
+        return parse_market_change(market_change, self._touch_market(market_id))
     
     def _update_market_definition(self, market_id: str, market_def: Dict):
         """Update cached market definition."""
-        if market_id not in self._market_cache:
-            self._market_cache[market_id] = {}
+        cache = self._touch_market(market_id)
+        if cache is None:
+            cache = self._market_cache[sys.intern(market_id)] = {}
+            if len(self._market_cache) > self.MARKET_CACHE_SIZE:
+                self._market_cache.popitem(last=False)
             
-        cache = self._market_cache[market_id]
         cache["name"] = market_def.get("name")
         cache["eventName"] = market_def.get("eventName")
         cache["inPlay"] = market_def.get("inPlay", False)
-        cache["runners"] = {}
         
-        for runner in market_def.get("runners", []):
-            runner_id = str(runner.get("id"))
+        # Definitions are resent on every status change; only rebuild the
+        # runner names when the runners themselves changed
+        runners = market_def.get("runners", [])
+        cached_runners = cache.get("runners")
+        if cached_runners is not None and len(cached_runners) == len(runners) and all(
+            intern_runner_id(runner.get("id")) in cached_runners for runner in runners
+        ):
+            return
+        
+        cache["runners"] = {}
+        for runner in runners:
+            runner_id = intern_runner_id(runner.get("id"))
             cache["runners"][runner_id] = runner.get("name", f"Runner {runner_id}")
     
     def _get_runner_name(self, market_id: str, runner_id: str) -> str:
         """Get runner name from cache."""
-        market_cache = self._market_cache.get(market_id, {})
+        market_cache = self._touch_market(market_id) or {}
         runners = market_cache.get("runners", {})
         return runners.get(runner_id, f"Runner {runner_id}")
     
+    def _touch_market(self, market_id: str) -> Optional[Dict]:
+        """Get cached market info, marking the market as recently used."""
+        market_info = self._market_cache.get(market_id)
+        if market_info is not None:
+            self._market_cache.move_to_end(market_id)
+        return market_info
+    
     def _handle_disconnect(self):
         """Handle disconnection and potential reconnection."""
         self.status = StreamStatus.DISCONNECTED
@@ -470,9 +904,11 @@ class BetfairStreamClient:
             time.sleep(self.config.reconnect_interval)
             
             if self.connect(self.config):
-                # Resubscribe to markets
-                if self._subscribed_markets and self._callback:
-                    self.subscribe_markets(list(self._subscribed_markets), self._callback)
+                # Resubscribe to markets (with the previous options)
+                with self._sub_lock:
+                    if self._subscribed_markets or self._pending_sub_add:
+                        self._pending_sub_add.update(self._subscribed_markets)
+                        self._schedule_subscription_flush()
                 self._reconnect_attempts = 0
             else:
                 self._handle_disconnect()  # Retry
@@ -482,20 +918,17 @@ class BetfairStreamClient:
     
     def _send_message(self, message: Dict):
         """Send a message to the stream."""
-        if self.ssl_socket:
-            message_str = json.dumps(message) + '\r\n'
-            self.ssl_socket.send(message_str.encode('utf-8'))
+        self._send_many([message])
     
-    def _read_message(self) -> Optional[Dict]:
-        """Read a single message from the stream."""
-        try:
-            data = self.ssl_socket.recv(self.config.buffer_size).decode('utf-8')
-            if '\r\n' in data:
-                message_str = data.split('\r\n')[0]
-                return json.loads(message_str)
-        except:
-            pass
-        return None
+    def _send_many(self, messages: List[Dict]):
+        """Send several messages to the stream in a single write."""
+        self._send_raw(b"".join(orjson.dumps(message) + b"\r\n" for message in messages))
+    
+    def _send_raw(self, payload: bytes):
+        """Write already framed bytes to the stream."""
+        if self.ssl_socket:
+            with self._send_lock:
+                self.ssl_socket.sendall(payload)
     
     def _get_next_id(self) -> int:
         """Get next message ID."""
@@ -1,22 +1,21 @@
 """Factory for creating data provider instances."""
 
 import logging
-from typing import Dict, Type, Optional
+from typing import Dict, Type, Optional, Tuple
 from .base import BaseDataProvider
-from .betfair import BetfairProvider
+from . import betfair  # noqa: F401  (defining BetfairProvider registers "betfair")
 
 
 class DataProviderFactory:
     """Factory class for creating data provider instances."""
     
-    # Registry of available providers
-    _providers: Dict[str, Type[BaseDataProvider]] = {
-        "betfair": BetfairProvider,
-        # Future providers can be added here:
-        # "pinnacle": PinnacleProvider,
-        # "smarkets": SmarketsProvider,
-        # "betdaq": BetdaqProvider,
-    }
+    # Registry of available providers, shared with BaseDataProvider so
+    # subclasses declared with name="..." appear here automatically
+    _providers: Dict[str, Type[BaseDataProvider]] = BaseDataProvider._registry
+    
+    # Default logger per provider, and the registered names (rebuilt when the registry grows)
+    _logger_cache: Dict[str, logging.Logger] = {}
+    _provider_names: Tuple[str, ...] = tuple(_providers)
     
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[BaseDataProvider]) -> None:
@@ -31,6 +30,7 @@ class DataProviderFactory:
             raise TypeError(f"{provider_class} must be a subclass of BaseDataProvider")
             
         cls._providers[name.lower()] = provider_class
+        cls._provider_names = tuple(cls._providers)
         logging.info(f"Registered provider: {name}")
     
     @classmethod
@@ -52,33 +52,39 @@ class DataProviderFactory:
         Raises:
             ValueError: If provider name is not recognized
         """
-        provider_name = provider_name.lower()
+        if not provider_name.islower():
+            provider_name = provider_name.lower()
         
-        if provider_name not in cls._providers:
-            available = ", ".join(cls._providers.keys())
+        provider_class = cls._providers.get(provider_name)
+        if provider_class is None:
+            available = ", ".join(cls.list_providers())
             raise ValueError(
                 f"Unknown provider '{provider_name}'. "
                 f"Available providers: {available}"
             )
         
-        provider_class = cls._providers[provider_name]
-        
-        # Create logger if not provided
+        # Use the provider's shared logger if none provided
         if logger is None:
-            logger = logging.getLogger(f"providers.{provider_name}")
+            logger = cls._logger_cache.get(provider_name)
+            if logger is None:
+                logger = cls._logger_cache.setdefault(
+                    provider_name, logging.getLogger(f"providers.{provider_name}")
+                )
             
         # Create and return provider instance
         return provider_class(logger=logger)
     
     @classmethod
-    def list_providers(cls) -> list:
+    def list_providers(cls) -> Tuple[str, ...]:
         """
-        Get list of available provider names.
+        Get available provider names.
         
         Returns:
-            List of registered provider names
+            Tuple of registered provider names
         """
-        return list(cls._providers.keys())
+        if len(cls._provider_names) != len(cls._providers):
+            cls._provider_names = tuple(cls._providers)
+        return cls._provider_names
     
     @classmethod
     def create_multiple_providers(
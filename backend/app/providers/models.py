@@ -1,10 +1,15 @@
 """Universal data models for provider-agnostic streaming."""
 
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from enum import Enum
 
+from ..utils.slots import add_slots
+from ..utils.timestamps import ns_to_datetime, datetime_to_ns
+
 
 class StreamStatus(Enum):
     """Stream connection status."""
@@ -32,6 +37,7 @@ class Side(Enum):
     LAY = "lay"
 
 
+@add_slots
 @dataclass
 class PriceVolume:
     """Price and volume tuple."""
@@ -42,9 +48,19 @@ class PriceVolume:
         return f"{self.price}@{self.volume:.2f}"
 
 
+_price_key = attrgetter("price")
+
+
+@add_slots
 @dataclass
 class RunnerPrices:
-    """Prices for a single runner/selection."""
+    """
+    Prices for a single runner/selection.
+    
+    Ladders are kept sorted best first: back_prices highest price first,
+    lay_prices lowest price first. They are sorted once on construction;
+    change levels through add_level() to keep the order.
+    """
     runner_id: str
     runner_name: Optional[str] = None
     back_prices: List[PriceVolume] = field(default_factory=list)
@@ -55,6 +71,40 @@ class RunnerPrices:
     available_to_lay: Optional[float] = None
     line: Optional[float] = None  # For handicap/total markets
     
+    def __post_init__(self):
+        self.back_prices.sort(key=_price_key, reverse=True)
+        self.lay_prices.sort(key=_price_key)
+    
+    def add_level(self, side: Side, price: float, volume: float) -> None:
+        """
+        Set the volume at a price level, keeping the ladder sorted.
+        
+        Args:
+            side: Ladder to update
+            price: Price level
+            volume: Volume at that price (0 removes the level)
+        """
+        levels = self.back_prices if side is Side.BACK else self.lay_prices
+        descending = side is Side.BACK
+        
+        # Binary search for the first level not better than price
+        lo, hi = 0, len(levels)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            level_price = levels[mid].price
+            if (level_price > price) if descending else (level_price < price):
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        if lo < len(levels) and levels[lo].price == price:
+            if volume > 0:
+                levels[lo].volume = volume
+            else:
+                del levels[lo]
+        elif volume > 0:
+            levels.insert(lo, PriceVolume(price, volume))
+    
     @property
     def best_back(self) -> Optional[PriceVolume]:
         """Get best back price (highest)."""
@@ -66,40 +116,71 @@ class RunnerPrices:
         return self.lay_prices[0] if self.lay_prices else None
 
 
+@add_slots
 @dataclass
 class MarketPrices:
-    """Market prices snapshot."""
+    """
+    Market prices snapshot.
+    
+    Runners are a list rather than a dict: tennis markets have two, and
+    a linear scan over two ids is cheaper than hashing.
+    """
     market_id: str
     market_name: Optional[str] = None
     event_name: Optional[str] = None
-    runners: Dict[str, RunnerPrices] = field(default_factory=dict)
+    runners: List[RunnerPrices] = field(default_factory=list)
     total_matched: Optional[float] = None
     total_available: Optional[float] = None
     in_play: bool = False
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a datetime (converted from timestamp_ns on access)."""
+        return ns_to_datetime(self.timestamp_ns)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.timestamp_ns = datetime_to_ns(value)
     
     def get_runner(self, runner_id: str) -> Optional[RunnerPrices]:
         """Get runner prices by ID."""
-        return self.runners.get(runner_id)
+        for runner in self.runners:
+            if runner.runner_id == runner_id:
+                return runner
+        return None
 
 
+@add_slots
 @dataclass
 class StreamMessage:
     """Universal streaming message format."""
     type: MessageType
-    timestamp: datetime
     provider: str
     data: Any = None
     market_id: Optional[str] = None
     error: Optional[str] = None
     raw_message: Optional[Dict] = None
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a datetime (converted from timestamp_ns on access)."""
+        return ns_to_datetime(self.timestamp_ns)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.timestamp_ns = datetime_to_ns(value)
+    
+    def release_raw(self) -> None:
+        """Drop the raw provider payload once consumers are done with it."""
+        self.raw_message = None
     
     @classmethod
     def connection_message(cls, provider: str, status: str, **kwargs):
         """Create a connection status message."""
         return cls(
             type=MessageType.CONNECTION,
-            timestamp=datetime.now(),
             provider=provider,
             data={"status": status, **kwargs}
         )
@@ -109,7 +190,6 @@ class StreamMessage:
         """Create a heartbeat message."""
         return cls(
             type=MessageType.HEARTBEAT,
-            timestamp=datetime.now(),
             provider=provider
         )
     
@@ -118,42 +198,55 @@ class StreamMessage:
         """Create a market change message."""
         return cls(
             type=MessageType.MARKET_CHANGE,
-            timestamp=datetime.now(),
             provider=provider,
             market_id=market_prices.market_id,
             data=market_prices,
             raw_message=raw
         )
     
+    @classmethod
+    def market_change_batch(cls, provider: str, market_prices_list: List[MarketPrices], raw=None):
+        """
+        Create one market change message carrying several markets.
+        
+        data is the list of MarketPrices and market_id is None;
+        consumers check isinstance(message.data, list).
+        """
+        return cls(
+            type=MessageType.MARKET_CHANGE,
+            provider=provider,
+            data=market_prices_list,
+            raw_message=raw
+        )
+    
     @classmethod
     def error_message(cls, provider: str, error: str, **kwargs):
         """Create an error message."""
         return cls(
             type=MessageType.ERROR,
-            timestamp=datetime.now(),
             provider=provider,
             error=error,
             data=kwargs
         )
 
 
+@add_slots
 @dataclass
 class StreamConfig:
     """Configuration for streaming connection."""
     conflate_ms: int = 120  # Conflation rate in milliseconds
     heartbeat_ms: int = 5000  # Heartbeat interval
-    buffer_size: int = 1024  # Read buffer size
+    buffer_size: int = 65536  # Read buffer size (grows for larger messages)
+    coalesce_ms: int = 20  # Window for merging market updates (0 = deliver each)
+    batch_size: int = 32  # Max markets per coalesced message (1 = one message per market)
+    drop_on_slow_consumer: bool = False  # Drop oldest queued message instead of blocking reads
     auto_reconnect: bool = True
     max_reconnect_attempts: int = 5
     reconnect_interval: int = 5  # Seconds between reconnect attempts
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return {
-            "conflate_ms": self.conflate_ms,
-            "heartbeat_ms": self.heartbeat_ms,
-            "buffer_size": self.buffer_size,
-            "auto_reconnect": self.auto_reconnect,
-            "max_reconnect_attempts": self.max_reconnect_attempts,
-            "reconnect_interval": self.reconnect_interval
-        }
\ No newline at end of file
+        return {name: getattr(self, name) for name in _STREAM_CONFIG_FIELDS}
+
+
+_STREAM_CONFIG_FIELDS = tuple(f.name for f in fields(StreamConfig))
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
@@ -20,16 +21,85 @@ from .tennis_models import (
 )
 
 
+# Set scores such as "6-4" with an optional tiebreak, e.g. "7-6(7-5)"
+_SCORE_RE = re.compile(r'(\d+)-(\d+)(?:\((\d+)-(\d+)\))?')
+
+# Player name separators: "A v B", "A vs B", "A - B"
+_VS_RE = re.compile(r' (?:vs?|-) ')
+
+# Tournament name keywords, highest priority first
+_LEVEL_KEYWORDS = (
+    ("australian open", TournamentLevel.GRAND_SLAM),
+    ("french open", TournamentLevel.GRAND_SLAM),
+    ("wimbledon", TournamentLevel.GRAND_SLAM),
+    ("us open", TournamentLevel.GRAND_SLAM),
+    ("atp 1000", TournamentLevel.ATP_1000),
+    ("masters", TournamentLevel.ATP_1000),
+    ("atp 500", TournamentLevel.ATP_500),
+    ("atp 250", TournamentLevel.ATP_250),
+    ("wta 1000", TournamentLevel.WTA_1000),
+    ("wta 500", TournamentLevel.WTA_500),
+    ("wta 250", TournamentLevel.WTA_250),
+    ("challenger", TournamentLevel.CHALLENGER),
+    ("itf", TournamentLevel.ITF),
+)
+_LEVEL_RE = re.compile("|".join(re.escape(keyword) for keyword, _ in _LEVEL_KEYWORDS))
+_LEVEL_RANK = {keyword: (rank, level) for rank, (keyword, level) in enumerate(_LEVEL_KEYWORDS)}
+
+
+@lru_cache(maxsize=1024)
+def _classify_level(tournament_name: str) -> TournamentLevel:
+    """Determine tournament level from name (names repeat, so results are cached)."""
+    # One scan for every keyword; if several appear the highest priority wins
+    keywords = _LEVEL_RE.findall(tournament_name.lower())
+    if not keywords:
+        return TournamentLevel.OTHER
+    return min(_LEVEL_RANK[keyword] for keyword in keywords)[1]
+
+
+@lru_cache(maxsize=1024)
+def _classify_surface(surface_str: str) -> Surface:
+    """Determine surface type from string (cached like _classify_level)."""
+    surface_lower = surface_str.lower()
+    
+    if "hard" in surface_lower:
+        return Surface.HARD
+    elif "clay" in surface_lower:
+        return Surface.CLAY
+    elif "grass" in surface_lower:
+        return Surface.GRASS
+    elif "carpet" in surface_lower:
+        return Surface.CARPET
+    else:
+        return Surface.UNKNOWN
+
+
 class MatchNormalizer:
     """Normalizes match data from different providers to common format."""
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
-        """Initialize normalizer."""
+    def __init__(self, logger: Optional[logging.Logger] = None, keep_raw_data: bool = False):
+        """
+        Initialize normalizer.
+        
+        Args:
+            logger: Logger instance
+            keep_raw_data: Keep the full provider payload in match metadata (debugging only)
+        """
         self.logger = logger or logging.getLogger(__name__)
+        self.keep_raw_data = keep_raw_data
         
-        # Patterns for parsing scores
-        self.score_pattern = re.compile(r'(\d+)-(\d+)')
-        self.tiebreak_pattern = re.compile(r'\((\d+)-(\d+)\)')
+        # Provider name -> normalizer, built once
+        self._match_dispatch = {
+            "betfair": self._normalize_betfair_match,
+            "pinnacle": self._normalize_pinnacle_match,
+            "smarkets": self._normalize_smarkets_match
+        }
+        self._score_dispatch = {
+            "betfair": self._normalize_betfair_score
+        }
+        self._statistics_dispatch = {
+            "betfair": self._parse_betfair_statistics
+        }
         
     def normalize_match(self, provider: str, raw_data: Dict[str, Any]) -> Optional[TennisMatch]:
         """
@@ -43,15 +113,11 @@ class MatchNormalizer:
             Normalized TennisMatch or None
         """
         try:
-            if provider.lower() == "betfair":
-                return self._normalize_betfair_match(raw_data)
-            elif provider.lower() == "pinnacle":
-                return self._normalize_pinnacle_match(raw_data)
-            elif provider.lower() == "smarkets":
-                return self._normalize_smarkets_match(raw_data)
-            else:
+            normalize = self._match_dispatch.get(provider.lower())
+            if normalize is None:
                 self.logger.warning(f"Unknown provider: {provider}")
                 return None
+            return normalize(raw_data)
                 
         except Exception as e:
             self.logger.error(f"Error normalizing match from {provider}: {e}")
@@ -69,13 +135,13 @@ class MatchNormalizer:
         
         # Create players
         runners = data.get("runners", [])
-        player1 = Player(
-            id=str(runners[0].get("selectionId")) if runners else "1",
-            name=player1_name
+        player1 = Player.get(
+            str(runners[0].get("selectionId")) if runners else "1",
+            player1_name
         )
-        player2 = Player(
-            id=str(runners[1].get("selectionId")) if runners else "2",
-            name=player2_name
+        player2 = Player.get(
+            str(runners[1].get("selectionId")) if runners else "2",
+            player2_name
         )
         
         # Determine status
@@ -98,7 +164,7 @@ class MatchNormalizer:
             status=status,
             market_id=market_id,
             scheduled_start=data.get("marketStartTime"),
-            metadata={"raw_data": data}
+            metadata={"raw_data": data} if self.keep_raw_data else {"raw_ref": market_id}
         )
         
         # Try to extract score if available
@@ -108,31 +174,30 @@ class MatchNormalizer:
         
         # Extract price data if available
         price_data = data.get("priceData")
-        if price_data and price_data.get("runners"):
+        price_runners = price_data.get("runners") if price_data else None
+        if price_runners:
             odds = {}
-            for runner in price_data.get("runners", []):
-                runner_name = runner.get("selectionId")
-                # Map selection IDs to player positions
-                # In Betfair, runners[0] is typically player1, runners[1] is player2
-                runner_idx = price_data.get("runners", []).index(runner)
+            # In Betfair, runners[0] is typically player1, runners[1] is player2
+            for runner_idx, runner in enumerate(price_runners):
                 player_key = f"player{runner_idx + 1}"
                 
                 # Get best back and lay prices
-                ex = runner.get("ex", {})
-                available_to_back = ex.get("availableToBack", [])
-                available_to_lay = ex.get("availableToLay", [])
+                ex = runner.get("ex") or {}
+                available_to_back = ex.get("availableToBack")
+                available_to_lay = ex.get("availableToLay")
                 
                 if available_to_back:
-                    odds[f"{player_key}_back"] = available_to_back[0].get("price")
-                    odds[f"{player_key}_back_size"] = available_to_back[0].get("size")
+                    best_back = available_to_back[0]
+                    odds[f"{player_key}_back"] = best_back.get("price")
+                    odds[f"{player_key}_back_size"] = best_back.get("size")
                 
                 if available_to_lay:
-                    odds[f"{player_key}_lay"] = available_to_lay[0].get("price")
-                    odds[f"{player_key}_lay_size"] = available_to_lay[0].get("size")
+                    best_lay = available_to_lay[0]
+                    odds[f"{player_key}_lay"] = best_lay.get("price")
+                    odds[f"{player_key}_lay_size"] = best_lay.get("size")
             
             # Store odds in match object
             match.odds = odds
-            match.metadata["prices"] = odds  # Also store in metadata for backward compatibility
         
         return match
     
@@ -158,11 +223,9 @@ class MatchNormalizer:
             Normalized TennisScore or None
         """
         try:
-            if provider.lower() == "betfair":
-                return self._parse_betfair_score(raw_score, None, None)
-            # Add other providers as needed
-            else:
-                return None
+            # Add other providers to _score_dispatch as needed
+            normalize = self._score_dispatch.get(provider.lower())
+            return normalize(raw_score) if normalize else None
                 
         except Exception as e:
             self.logger.error(f"Error normalizing score from {provider}: {e}")
@@ -180,11 +243,9 @@ class MatchNormalizer:
             Normalized MatchStatistics or None
         """
         try:
-            if provider.lower() == "betfair":
-                return self._parse_betfair_statistics(raw_stats)
-            # Add other providers as needed
-            else:
-                return None
+            # Add other providers to _statistics_dispatch as needed
+            normalize = self._statistics_dispatch.get(provider.lower())
+            return normalize(raw_stats) if normalize else None
                 
         except Exception as e:
             self.logger.error(f"Error normalizing statistics from {provider}: {e}")
@@ -193,13 +254,8 @@ class MatchNormalizer:
     def _parse_player_names(self, event_name: str) -> Tuple[str, str]:
         """Parse player names from event name."""
         # Common patterns: "Player1 v Player2", "Player1 vs Player2"
-        if " v " in event_name:
-            parts = event_name.split(" v ")
-        elif " vs " in event_name:
-            parts = event_name.split(" vs ")
-        elif " - " in event_name:
-            parts = event_name.split(" - ")
-        else:
+        parts = _VS_RE.split(event_name)
+        if len(parts) < 2:
             parts = [event_name, "Unknown"]
         
         player1 = parts[0].strip() if parts else "Player 1"
@@ -207,6 +263,10 @@ class MatchNormalizer:
         
         return player1, player2
     
+    def _normalize_betfair_score(self, score_data: Any) -> TennisScore:
+        """Normalize a Betfair score with no known players."""
+        return self._parse_betfair_score(score_data, None, None)
+    
     def _parse_betfair_score(self, score_data: Any, player1: Optional[Player], player2: Optional[Player]) -> TennisScore:
         """Parse Betfair score format."""
         if isinstance(score_data, str):
@@ -222,9 +282,9 @@ class MatchNormalizer:
         """Parse score from string format."""
         # Default players if not provided
         if not player1:
-            player1 = Player(id="1", name="Player 1")
+            player1 = Player.get("1", "Player 1")
         if not player2:
-            player2 = Player(id="2", name="Player 2")
+            player2 = Player.get("2", "Player 2")
         
         score = TennisScore(
             match_id="",
@@ -232,45 +292,48 @@ class MatchNormalizer:
             player2=player2
         )
         
-        # Split into sets
-        set_scores = score_str.strip().split()
+        # Sets won, counted as they are parsed
+        p1_sets = p2_sets = 0
         
-        for set_str in set_scores:
-            # Parse basic score
-            match = self.score_pattern.search(set_str)
-            if match:
-                p1_games = int(match.group(1))
-                p2_games = int(match.group(2))
-                
-                set_score = SetScore(
-                    player1_games=p1_games,
-                    player2_games=p2_games
-                )
-                
-                # Check for tiebreak
-                tb_match = self.tiebreak_pattern.search(set_str)
-                if tb_match:
-                    set_score.is_tiebreak = True
-                    set_score.tiebreak_score = {
-                        player1.id: int(tb_match.group(1)),
-                        player2.id: int(tb_match.group(2))
-                    }
-                
-                # Determine if set is complete
-                if (p1_games >= 6 or p2_games >= 6) and abs(p1_games - p2_games) >= 1:
-                    set_score.is_completed = True
-                    set_score.winner = player1.id if p1_games > p2_games else player2.id
-                
-                score.sets.append(set_score)
+        # One match per set, with its tiebreak if present
+        for match in _SCORE_RE.finditer(score_str):
+            p1_games, p2_games, p1_tiebreak, p2_tiebreak = match.groups()
+            p1_games = int(p1_games)
+            p2_games = int(p2_games)
+            
+            set_score = SetScore(
+                player1_games=p1_games,
+                player2_games=p2_games
+            )
+            
+            # Check for tiebreak
+            if p1_tiebreak is not None:
+                set_score.is_tiebreak = True
+                set_score.tiebreak_score = {
+                    player1.id: int(p1_tiebreak),
+                    player2.id: int(p2_tiebreak)
+                }
+            
+            # Determine if set is complete
+            if p1_games != p2_games and (p1_games >= 6 or p2_games >= 6):
+                set_score.is_completed = True
+                if p1_games > p2_games:
+                    set_score.winner = player1.id
+                    p1_sets += 1
+                else:
+                    set_score.winner = player2.id
+                    p2_sets += 1
+            
+            score.sets.append(set_score)
         
         # Update current set
         score.current_set = len(score.sets)
         
         # Determine match status
-        if score.player1_sets_won > score.total_sets // 2:
+        if p1_sets >= score.sets_to_win:
             score.match_status = MatchStatus.COMPLETED
             score.winner = player1
-        elif score.player2_sets_won > score.total_sets // 2:
+        elif p2_sets >= score.sets_to_win:
             score.match_status = MatchStatus.COMPLETED
             score.winner = player2
         elif score.sets:
@@ -293,40 +356,8 @@ class MatchNormalizer:
     
     def _determine_tournament_level(self, tournament_name: str) -> TournamentLevel:
         """Determine tournament level from name."""
-        name_lower = tournament_name.lower()
-        
-        if any(gs in name_lower for gs in ["australian open", "french open", "wimbledon", "us open"]):
-            return TournamentLevel.GRAND_SLAM
-        elif "atp 1000" in name_lower or "masters" in name_lower:
-            return TournamentLevel.ATP_1000
-        elif "atp 500" in name_lower:
-            return TournamentLevel.ATP_500
-        elif "atp 250" in name_lower:
-            return TournamentLevel.ATP_250
-        elif "wta 1000" in name_lower:
-            return TournamentLevel.WTA_1000
-        elif "wta 500" in name_lower:
-            return TournamentLevel.WTA_500
-        elif "wta 250" in name_lower:
-            return TournamentLevel.WTA_250
-        elif "challenger" in name_lower:
-            return TournamentLevel.CHALLENGER
-        elif "itf" in name_lower:
-            return TournamentLevel.ITF
-        else:
-            return TournamentLevel.OTHER
+        return _classify_level(tournament_name)
     
     def _determine_surface(self, surface_str: str) -> Surface:
         """Determine surface type from string."""
-        surface_lower = surface_str.lower()
-        
-        if "hard" in surface_lower:
-            return Surface.HARD
-        elif "clay" in surface_lower:
-            return Surface.CLAY
-        elif "grass" in surface_lower:
-            return Surface.GRASS
-        elif "carpet" in surface_lower:
-            return Surface.CARPET
-        else:
-            return Surface.UNKNOWN
\ No newline at end of file
+        return _classify_surface(surface_str)
\ No newline at end of file
@@ -1,10 +1,15 @@
 """Provider-agnostic tennis data models."""
 
+import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from enum import Enum
 
+from ..utils.slots import add_slots
+from ..utils.timestamps import ns_to_datetime, datetime_to_ns
+
 
 class MatchStatus(Enum):
     """Match status."""
@@ -17,6 +22,10 @@ class MatchStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# Statuses for a match that has ended
+_FINISHED_STATUSES = frozenset({MatchStatus.COMPLETED, MatchStatus.RETIRED, MatchStatus.WALKOVER})
+
+
 class Surface(Enum):
     """Tennis court surface."""
     HARD = "hard"
@@ -41,9 +50,10 @@ class TournamentLevel(Enum):
     OTHER = "other"
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class Player:
-    """Tennis player information."""
+    """Tennis player information (immutable; Player.get shares instances)."""
     id: str
     name: str
     country: Optional[str] = None
@@ -53,8 +63,33 @@ class Player:
     
     def __hash__(self):
         return hash(self.id)
+    
+    @classmethod
+    def get(cls, player_id: str, name: str) -> "Player":
+        """
+        Get the shared Player instance for an id/name pair.
+        
+        Providers see the same selections on every update, so players
+        are interned instead of re-allocated. Player is frozen, so a
+        shared instance cannot be changed by one match under another.
+        
+        Args:
+            player_id: Provider player/selection id
+            name: Player name
+            
+        Returns:
+            Interned Player
+        """
+        return _intern_player(player_id, name)
+
 
+@lru_cache(maxsize=4096)
+def _intern_player(player_id: str, name: str) -> Player:
+    """Build a Player once per id/name pair (bounded, least recently used first out)."""
+    return Player(id=player_id, name=name)
 
+
+@add_slots
 @dataclass
 class GameScore:
     """Current game score (points)."""
@@ -66,6 +101,7 @@ class GameScore:
     tiebreak_points: Optional[Dict[str, int]] = None  # {"player1": 5, "player2": 3}
 
 
+@add_slots
 @dataclass
 class SetScore:
     """Score for a single set."""
@@ -77,6 +113,7 @@ class SetScore:
     winner: Optional[str] = None  # Player ID
 
 
+@add_slots
 @dataclass
 class TennisScore:
     """Complete tennis match score."""
@@ -90,7 +127,21 @@ class TennisScore:
     server: Optional[Player] = None
     match_status: MatchStatus = MatchStatus.NOT_STARTED
     winner: Optional[Player] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    sets_to_win: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Fixed for the match; total_sets is set at construction
+        self.sets_to_win = self.total_sets // 2 + 1
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Score time as a datetime (converted from timestamp_ns on access)."""
+        return ns_to_datetime(self.timestamp_ns)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.timestamp_ns = datetime_to_ns(value)
     
     @property
     def player1_sets_won(self) -> int:
@@ -124,6 +175,7 @@ class TennisScore:
         return " ".join(score_parts)
 
 
+@add_slots
 @dataclass
 class ServeStatistics:
     """Serving statistics."""
@@ -168,6 +220,7 @@ class ServeStatistics:
         return (self.break_points_saved / self.break_points_faced) * 100
 
 
+@add_slots
 @dataclass
 class ReturnStatistics:
     """Return statistics."""
@@ -193,6 +246,7 @@ class ReturnStatistics:
         return (self.break_points_won / self.break_points_opportunities) * 100
 
 
+@add_slots
 @dataclass
 class MatchStatistics:
     """Complete match statistics."""
@@ -234,6 +288,7 @@ class MatchStatistics:
         return (self.player2_net_points_won / self.player2_net_points_total) * 100
 
 
+@add_slots
 @dataclass
 class TennisMatch:
     """Complete tennis match information."""
@@ -270,13 +325,18 @@ class TennisMatch:
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    @property
+    def prices(self) -> Optional[Dict[str, float]]:
+        """Best prices by player (alias of odds, formerly metadata["prices"])."""
+        return self.odds
+    
     def is_live(self) -> bool:
         """Check if match is currently live."""
         return self.status == MatchStatus.IN_PROGRESS
     
     def is_finished(self) -> bool:
         """Check if match is finished."""
-        return self.status in [MatchStatus.COMPLETED, MatchStatus.RETIRED, MatchStatus.WALKOVER]
+        return self.status in _FINISHED_STATUSES
     
     def get_current_server(self) -> Optional[Player]:
         """Get current server from score."""
@@ -1,8 +1,9 @@
 """Position calculator for P&L, hedging, and risk calculations."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime
+from functools import lru_cache
 import math
 
 from app.risk.models import (
@@ -11,8 +12,152 @@ from app.risk.models import (
 )
 
 
+# Shared Decimal constants, parsed once rather than on every call
+_ZERO = Decimal("0")
+_PENNY = Decimal("0.01")
+_PROBABILITY_STEP = Decimal("0.0001")
+
+# Betfair odds ladder bands: (from, to, increment)
+_LADDER_BANDS = (
+    ("1.01", "2", "0.01"),
+    ("2", "3", "0.02"),
+    ("3", "4", "0.05"),
+    ("4", "6", "0.1"),
+    ("6", "10", "0.2"),
+    ("10", "20", "0.5"),
+    ("20", "30", "1"),
+    ("30", "50", "2"),
+    ("50", "100", "5"),
+    ("100", "1000", "10"),
+)
+
+
+def _build_price_ladder() -> Tuple[Decimal, ...]:
+    """Every valid Betfair price from 1.01 to 1000."""
+    prices = []
+    for start, stop, step in _LADDER_BANDS:
+        price, stop, step = Decimal(start), Decimal(stop), Decimal(step)
+        while price < stop:
+            prices.append(price)
+            price += step
+    prices.append(Decimal("1000"))
+    return tuple(prices)
+
+
+BETFAIR_PRICE_LADDER = _build_price_ladder()
+
+# Prices come from a fixed ladder (~350 ticks), so these pure results
+# repeat constantly. Decimal is hashable and used directly as the key.
+
+@lru_cache(maxsize=2048)
+def _implied_probability(decimal_odds: Decimal) -> Decimal:
+    """Implied probability for decimal odds (see calculate_implied_probability)."""
+    if decimal_odds <= 1:
+        return Decimal("1")
+    
+    return (Decimal("1") / decimal_odds).quantize(_PROBABILITY_STEP)
+
+
+@lru_cache(maxsize=2048)
+def _break_even_price(entry_price: Decimal, side: PositionSide, commission_rate: Decimal) -> Decimal:
+    """Commission-adjusted break-even price (see calculate_break_even_price)."""
+    # For back bets: break_even = entry_price / (1 - commission_rate)
+    # For lay bets: break_even = entry_price * (1 - commission_rate)
+    
+    if side == PositionSide.LONG:
+        break_even = entry_price / (1 - commission_rate)
+    else:
+        break_even = entry_price * (1 - commission_rate)
+    
+    return break_even.quantize(_PENNY)
+
+
+@lru_cache(maxsize=4096)
+def _outcome_pnl(
+    side: PositionSide,
+    entry_price: Decimal,
+    current_size: Decimal,
+    commission_rate: Decimal
+) -> Tuple[Decimal, Decimal]:
+    """P&L of a position if its selection loses, and the swing if it wins.
+    
+    Keyed on the position's values, so a mutated position simply misses.
+    
+    Returns:
+        Tuple of (lose_pnl, win_pnl - lose_pnl)
+    """
+    net_rate = 1 - commission_rate
+    
+    if side == PositionSide.LONG:
+        # Back bet wins (commission on profit) or loses the stake
+        win_pnl = (entry_price - 1) * current_size * net_rate
+        lose_pnl = -current_size
+    else:
+        # Lay bet loses the liability or wins the stake (commission on profit)
+        win_pnl = -(entry_price - 1) * current_size
+        lose_pnl = current_size * net_rate
+    
+    return lose_pnl, win_pnl - lose_pnl
+
+
+@lru_cache(maxsize=2048)
+def _kelly_stake(
+    probability: Decimal,
+    odds: Decimal,
+    bankroll: Decimal,
+    kelly_fraction: Decimal
+) -> Decimal:
+    """Fractional Kelly stake (see calculate_optimal_stake)."""
+    if probability <= 0 or probability >= 1:
+        return _ZERO
+    
+    if odds <= 1:
+        return _ZERO
+    
+    # Kelly formula: f = (p * (odds - 1) - (1 - p)) / (odds - 1)
+    # Simplified: f = (p * odds - 1) / (odds - 1)
+    
+    edge = probability * odds - 1
+    
+    if edge <= 0:
+        return _ZERO
+    
+    kelly_full = edge / (odds - 1)
+    kelly_adjusted = kelly_full * kelly_fraction
+    
+    # Cap at maximum percentage of bankroll
+    max_stake = bankroll * Decimal("0.1")  # Max 10% per bet
+    
+    stake = min(bankroll * kelly_adjusted, max_stake)
+    
+    # Round to reasonable amount
+    if stake < Decimal("2"):
+        return _ZERO
+    
+    return stake.quantize(_PENNY)
+
+
+def _kelly_float(probability: float, odds: float, bankroll: float, kelly_fraction: float) -> float:
+    """Float version of _kelly_stake, unrounded (0.0 when there is no bet)."""
+    if probability <= 0.0 or probability >= 1.0 or odds <= 1.0:
+        return 0.0
+    
+    edge = probability * odds - 1.0
+    if edge <= 0.0:
+        return 0.0
+    
+    stake = min(edge / (odds - 1.0) * kelly_fraction * bankroll, 0.1 * bankroll)
+    return stake if stake >= 2.0 else 0.0
+
+
 class PositionCalculator:
-    """Calculates P&L, hedging requirements, and optimal position sizes."""
+    """Calculates P&L, hedging requirements, and optimal position sizes.
+    
+    Methods taking a list of positions skip closed (zero-size) ones, but
+    callers should pass live positions only - e.g. from
+    PositionTracker.get_open_positions() or filter_live() - so closed
+    history is not walked on every call.
+    """
     
     def __init__(self, commission_rate: Decimal = Decimal("0.02")):
         """Initialize calculator.
@@ -21,6 +166,39 @@ class PositionCalculator:
             commission_rate: Commission rate (default 2% for Betfair)
         """
         self.commission_rate = commission_rate
+    
+    @staticmethod
+    def filter_live(positions: Iterable[Position]) -> List[Position]:
+        """Keep only positions with size still open.
+        
+        Args:
+            positions: Positions to filter
+            
+        Returns:
+            Positions with non-zero current size
+        """
+        return [pos for pos in positions if pos.current_size]
+    
+    @property
+    def commission_rate(self) -> Decimal:
+        """Commission rate charged on net winnings."""
+        return self._commission_rate
+    
+    @commission_rate.setter
+    def commission_rate(self, value: Decimal) -> None:
+        # Share of winnings kept after commission, derived once per rate change
+        self._commission_rate = value
+        self._one_minus_comm = 1 - value
+        
+        # Break-even price for every ladder price, by side
+        self._break_even_long = {
+            price: _break_even_price(price, PositionSide.LONG, value)
+            for price in BETFAIR_PRICE_LADDER
+        }
+        self._break_even_short = {
+            price: _break_even_price(price, PositionSide.SHORT, value)
+            for price in BETFAIR_PRICE_LADDER
+        }
         
     def calculate_pnl(
         self,
@@ -43,10 +221,7 @@ class PositionCalculator:
         
         # Calculate unrealized P&L
         if position.current_size > 0:
-            if position.side == PositionSide.LONG:
-                gross_pnl = (current_price - position.entry_price) * position.current_size
-            else:  # SHORT
-                gross_pnl = (position.entry_price - current_price) * position.current_size
+            gross_pnl = position.side_sign * (current_price - position.entry_price) * position.current_size
             
             # Apply commission on profits
             if include_commission and gross_pnl > 0:
@@ -55,10 +230,49 @@ class PositionCalculator:
             else:
                 unrealized_pnl = gross_pnl
         else:
-            unrealized_pnl = Decimal("0")
+            unrealized_pnl = _ZERO
         
         return realized_pnl, unrealized_pnl
         
+    def calculate_pnls_batch(
+        self,
+        positions: List[Position],
+        price_map: Dict[str, Decimal],
+        include_commission: bool = True
+    ) -> List[Tuple[Decimal, Decimal]]:
+        """Price many positions against one market snapshot in one call.
+        
+        Same result per position as calculate_pnl. A position whose
+        selection is missing from price_map keeps its last unrealized P&L.
+        
+        Args:
+            positions: Positions to calculate
+            price_map: Current price by selection ID
+            include_commission: Whether to include commission
+            
+        Returns:
+            List of (realized_pnl, unrealized_pnl), one per position
+        """
+        commission_rate = self.commission_rate if include_commission else _ZERO
+        results = []
+        
+        for position in positions:
+            current_price = price_map.get(position.selection_id)
+            if current_price is None:
+                results.append((position.realized_pnl, position.unrealized_pnl))
+                continue
+            
+            if position.current_size > 0:
+                unrealized_pnl = position.side_sign * (current_price - position.entry_price) * position.current_size
+                if unrealized_pnl > 0:
+                    unrealized_pnl -= unrealized_pnl * commission_rate
+            else:
+                unrealized_pnl = _ZERO
+            
+            results.append((position.realized_pnl, unrealized_pnl))
+        
+        return results
+        
     def calculate_hedge_requirement(
         self,
         positions: List[Position],
@@ -76,48 +290,35 @@ class PositionCalculator:
         if not positions:
             return None
         
-        # Group by market and selection
-        market_exposures: Dict[str, Dict[str, Decimal]] = {}
+        # Net exposure per (market, selection), in order of first appearance
+        exposures: Dict[Tuple[str, str], Decimal] = {}
         
         for pos in positions:
-            if pos.current_size == 0:
+            size = pos.current_size
+            if size == 0:
                 continue
-                
-            if pos.market_id not in market_exposures:
-                market_exposures[pos.market_id] = {}
-            
-            if pos.selection_id not in market_exposures[pos.market_id]:
-                market_exposures[pos.market_id][pos.selection_id] = Decimal("0")
             
             # Calculate exposure
             if pos.side == PositionSide.LONG:
-                exposure = pos.current_size
+                exposure = size
             else:  # SHORT
-                exposure = -pos.current_size * (pos.entry_price - 1)
-            
-            market_exposures[pos.market_id][pos.selection_id] += exposure
-        
-        # Find largest imbalance
-        max_imbalance = Decimal("0")
-        hedge_market = None
-        hedge_selection = None
-        hedge_side = None
-        
-        for market_id, selections in market_exposures.items():
-            for selection_id, exposure in selections.items():
-                imbalance = abs(exposure - target_exposure)
-                
-                if imbalance > max_imbalance:
-                    max_imbalance = imbalance
-                    hedge_market = market_id
-                    hedge_selection = selection_id
-                    
-                    # Determine hedge side
-                    if exposure > target_exposure:
-                        # Need to reduce exposure - lay if long, back if short
-                        hedge_side = PositionSide.SHORT
-                    else:
-                        hedge_side = PositionSide.LONG
+                exposure = -size * (pos.entry_price - 1)
+            
+            key = (pos.market_id, pos.selection_id)
+            exposures[key] = exposures.get(key, _ZERO) + exposure
+        
+        if not exposures:
+            return None
+        
+        # Find largest imbalance (first one wins a tie)
+        (hedge_market, hedge_selection), exposure = max(
+            exposures.items(),
+            key=lambda item: abs(item[1] - target_exposure)
+        )
+        max_imbalance = abs(exposure - target_exposure)
+        
+        # Need to reduce exposure - lay if long, back if short
+        hedge_side = PositionSide.SHORT if exposure > target_exposure else PositionSide.LONG
         
         # Only hedge if imbalance is significant
         if max_imbalance < Decimal("10"):  # Minimum hedge size
@@ -151,27 +352,20 @@ class PositionCalculator:
         Returns:
             Tuple of (net_size, net_value, average_price)
         """
-        long_size = Decimal("0")
-        long_value = Decimal("0")
-        short_size = Decimal("0")
-        short_value = Decimal("0")
+        net_size = _ZERO
+        net_value = _ZERO
         
+        # Longs add, shorts subtract
         for pos in positions:
             if pos.current_size > 0:
-                if pos.side == PositionSide.LONG:
-                    long_size += pos.current_size
-                    long_value += pos.current_size * pos.entry_price
-                else:
-                    short_size += pos.current_size
-                    short_value += pos.current_size * pos.entry_price
-        
-        net_size = long_size - short_size
-        net_value = long_value - short_value
+                signed_size = pos.side_sign * pos.current_size
+                net_size += signed_size
+                net_value += signed_size * pos.entry_price
         
         if net_size != 0:
             average_price = abs(net_value / net_size)
         else:
-            average_price = Decimal("0")
+            average_price = _ZERO
         
         return net_size, net_value, average_price
         
@@ -193,33 +387,39 @@ class PositionCalculator:
         Returns:
             Optimal stake size
         """
-        if probability <= 0 or probability >= 1:
-            return Decimal("0")
-        
-        if odds <= 1:
-            return Decimal("0")
+        return _kelly_stake(probability, odds, bankroll, kelly_fraction)
         
-        # Kelly formula: f = (p * (odds - 1) - (1 - p)) / (odds - 1)
-        # Simplified: f = (p * odds - 1) / (odds - 1)
-        
-        edge = probability * odds - 1
-        
-        if edge <= 0:
-            return Decimal("0")
-        
-        kelly_full = edge / (odds - 1)
-        kelly_adjusted = kelly_full * kelly_fraction
+    def calculate_optimal_stakes_batch(
+        self,
+        probabilities: List[Decimal],
+        odds: List[Decimal],
+        bankroll: Decimal,
+        kelly_fraction: Decimal = Decimal("0.25")
+    ) -> List[Decimal]:
+        """Size many candidate bets at once using Kelly Criterion.
         
-        # Cap at maximum percentage of bankroll
-        max_stake = bankroll * Decimal("0.1")  # Max 10% per bet
+        Intended for scanning a whole board. The arithmetic runs in floats
+        and each stake is rounded to pennies at the end, so a stake can
+        differ from calculate_optimal_stake by a penny at rounding edges.
         
-        stake = min(bankroll * kelly_adjusted, max_stake)
+        Args:
+            probabilities: Estimated win probabilities (0-1), one per bet
+            odds: Decimal odds, one per bet (same length as probabilities)
+            bankroll: Available bankroll
+            kelly_fraction: Fraction of Kelly to use (default 0.25 for safety)
+            
+        Returns:
+            Optimal stake sizes, one per bet
+        """
+        bankroll_f = float(bankroll)
+        fraction_f = float(kelly_fraction)
         
-        # Round to reasonable amount
-        if stake < Decimal("2"):
-            return Decimal("0")
+        stakes = []
+        for probability, price in zip(probabilities, odds):
+            stake = _kelly_float(float(probability), float(price), bankroll_f, fraction_f)
+            stakes.append(Decimal(f"{stake:.2f}") if stake else _ZERO)
         
-        return stake.quantize(Decimal("0.01"))
+        return stakes
         
     def calculate_break_even_price(
         self,
@@ -236,20 +436,21 @@ class PositionCalculator:
             Break-even price
         """
         if position.current_size == 0:
-            return Decimal("0")
+            return _ZERO
         
         if not include_commission:
             return position.entry_price
         
-        # For back bets: break_even = entry_price / (1 - commission_rate)
-        # For lay bets: break_even = entry_price * (1 - commission_rate)
-        
+        # Ladder prices come from the table; averaged entries fall back
         if position.side == PositionSide.LONG:
-            break_even = position.entry_price / (1 - self.commission_rate)
+            break_even = self._break_even_long.get(position.entry_price)
         else:
-            break_even = position.entry_price * (1 - self.commission_rate)
+            break_even = self._break_even_short.get(position.entry_price)
+        
+        if break_even is None:
+            break_even = _break_even_price(position.entry_price, position.side, self.commission_rate)
         
-        return break_even.quantize(Decimal("0.01"))
+        return break_even
         
     def calculate_risk_reward_ratio(
         self,
@@ -277,9 +478,9 @@ class PositionCalculator:
             potential_loss = stop_price - entry_price
         
         if potential_loss <= 0:
-            return Decimal("0")
+            return _ZERO
         
-        return (potential_profit / potential_loss).quantize(Decimal("0.01"))
+        return (potential_profit / potential_loss).quantize(_PENNY)
         
     def calculate_implied_probability(self, decimal_odds: Decimal) -> Decimal:
         """Calculate implied probability from decimal odds.
@@ -290,10 +491,7 @@ class PositionCalculator:
         Returns:
             Implied probability (0-1)
         """
-        if decimal_odds <= 1:
-            return Decimal("1")
-        
-        return (Decimal("1") / decimal_odds).quantize(Decimal("0.0001"))
+        return _implied_probability(decimal_odds)
         
     def calculate_arbitrage_opportunity(
         self,
@@ -311,20 +509,50 @@ class PositionCalculator:
         Returns:
             Tuple of (is_arbitrage, profit_percentage)
         """
-        if commission_rate is None:
-            commission_rate = self.commission_rate
+        net_rate = self._one_minus_comm if commission_rate is None else 1 - commission_rate
         
         # Account for commission on winnings
-        effective_back_odds = back_odds * (1 - commission_rate)
+        effective_back_odds = back_odds * net_rate
         
         # Arbitrage exists if back odds > lay odds after commission
         if effective_back_odds > lay_odds:
             # Calculate guaranteed profit percentage
             # Profit = (effective_back_odds / lay_odds - 1) * 100
-            profit_pct = ((effective_back_odds / lay_odds - 1) * 100).quantize(Decimal("0.01"))
+            profit_pct = ((effective_back_odds / lay_odds - 1) * 100).quantize(_PENNY)
             return True, profit_pct
         
-        return False, Decimal("0")
+        return False, _ZERO
+        
+    def calculate_arbitrage_opportunities(
+        self,
+        back_odds: List[Decimal],
+        lay_odds: List[Decimal],
+        commission_rate: Optional[Decimal] = None
+    ) -> List[Tuple[bool, Decimal]]:
+        """Check many back/lay price pairs for arbitrage in one call.
+        
+        Same result per pair as calculate_arbitrage_opportunity, with the
+        commission factor computed once for the whole scan.
+        
+        Args:
+            back_odds: Back odds, one per pair
+            lay_odds: Lay odds, one per pair (same length as back_odds)
+            commission_rate: Commission rate to account for
+            
+        Returns:
+            List of (is_arbitrage, profit_percentage), one per pair
+        """
+        net_rate = self._one_minus_comm if commission_rate is None else 1 - commission_rate
+        results = []
+        
+        for back, lay in zip(back_odds, lay_odds):
+            effective_back_odds = back * net_rate
+            if effective_back_odds > lay:
+                results.append((True, ((effective_back_odds / lay - 1) * 100).quantize(_PENNY)))
+            else:
+                results.append((False, _ZERO))
+        
+        return results
         
     def calculate_exposure_by_outcome(
         self,
@@ -338,50 +566,82 @@ class PositionCalculator:
         Returns:
             Dictionary of selection_id -> exposure
         """
-        exposures = {}
+        all_lose, swing = self._outcome_totals(positions)
+        
+        exposures = {
+            selection_id: all_lose + selection_swing
+            for selection_id, selection_swing in swing.items()
+        }
+        
+        return exposures
+        
+    def _outcome_totals(
+        self,
+        positions: List[Position]
+    ) -> Tuple[Decimal, Dict[str, Decimal]]:
+        """Sum outcome P&L components in one pass over positions.
+        
+        Each position pays one amount if its selection wins and another
+        if it loses. Exposure for an outcome is every position's losing
+        P&L plus, for positions on the winning selection, the swing
+        from losing to winning - one pass instead of selections x positions.
+        
+        Args:
+            positions: List of positions
+            
+        Returns:
+            Tuple of (total losing P&L, selection_id -> swing if it wins)
+        """
+        commission_rate = self.commission_rate
+        all_lose = _ZERO
+        swing: Dict[str, Decimal] = {}
         
-        # Group positions by selection
-        by_selection = {}
         for pos in positions:
             if pos.current_size == 0:
                 continue
-                
-            if pos.selection_id not in by_selection:
-                by_selection[pos.selection_id] = []
-            by_selection[pos.selection_id].append(pos)
-        
-        # Calculate exposure for each selection winning
-        for selection_id, selection_positions in by_selection.items():
-            selection_pnl = Decimal("0")
-            
-            for pos in positions:
-                if pos.current_size == 0:
-                    continue
-                    
-                if pos.selection_id == selection_id:
-                    # This selection wins
-                    if pos.side == PositionSide.LONG:
-                        # Back bet wins
-                        pnl = (pos.entry_price - 1) * pos.current_size
-                        pnl *= (1 - self.commission_rate)  # Commission on profit
-                    else:
-                        # Lay bet loses
-                        pnl = -(pos.entry_price - 1) * pos.current_size
-                else:
-                    # This selection loses
-                    if pos.side == PositionSide.LONG:
-                        # Back bet loses
-                        pnl = -pos.current_size
-                    else:
-                        # Lay bet wins
-                        pnl = pos.current_size
-                        pnl *= (1 - self.commission_rate)  # Commission on profit
-                
-                selection_pnl += pnl
-            
-            exposures[selection_id] = selection_pnl
+            
+            lose_pnl, win_swing = _outcome_pnl(
+                pos.side, pos.entry_price, pos.current_size, commission_rate
+            )
+            all_lose += lose_pnl
+            swing[pos.selection_id] = swing.get(pos.selection_id, _ZERO) + win_swing
         
-        return exposures
+        return all_lose, swing
+        
+    def min_outcome_pnl(self, positions: List[Position]) -> Optional[Decimal]:
+        """Get the worst-case P&L over all outcomes.
+        
+        Args:
+            positions: List of positions
+            
+        Returns:
+            Minimum exposure, or None if there are no open positions
+        """
+        all_lose, swing = self._outcome_totals(positions)
+        
+        if not swing:
+            return None
+        
+        return all_lose + min(swing.values())
+        
+    def is_guaranteed_profit(self, positions: List[Position]) -> bool:
+        """Check whether every outcome is profitable.
+        
+        Stops at the first losing outcome; use min_outcome_pnl when the
+        amount is needed.
+        
+        Args:
+            positions: List of positions
+            
+        Returns:
+            True if every outcome has positive P&L
+        """
+        all_lose, swing = self._outcome_totals(positions)
+        
+        if not swing:
+            return False
+        
+        return all(all_lose + selection_swing > 0 for selection_swing in swing.values())
         
     def calculate_guaranteed_profit(
         self,
@@ -395,15 +655,36 @@ class PositionCalculator:
         Returns:
             Tuple of (is_guaranteed, min_profit)
         """
-        exposures = self.calculate_exposure_by_outcome(positions)
+        min_exposure = self.min_outcome_pnl(positions)
         
-        if not exposures:
-            return False, Decimal("0")
-        
-        min_exposure = min(exposures.values())
+        if min_exposure is None:
+            return False, _ZERO
         
         # Guaranteed profit if minimum exposure is positive
         return min_exposure > 0, min_exposure
+    
+    @staticmethod
+    def cache_info() -> Dict[str, Dict[str, Any]]:
+        """Get hit/miss statistics for the cached price calculations.
+        
+        Returns:
+            Dictionary of cache name -> hits, misses, maxsize, currsize
+        """
+        return {
+            "implied_probability": _implied_probability.cache_info()._asdict(),
+            "break_even_price": _break_even_price.cache_info()._asdict(),
+            "outcome_pnl": _outcome_pnl.cache_info()._asdict(),
+            "kelly_stake": _kelly_stake.cache_info()._asdict()
+        }
+
+
+# Portfolio Greek rates for the default model parameters: theta decay of
+# 0.01 per hour (x2 inside an hour, x1.5 inside four) and vega for a 0.01
+# volatility change
+_THETA_RATE = Decimal("0.01")
+_THETA_RATE_NEAR = Decimal("0.015")
+_THETA_RATE_LAST_HOUR = Decimal("0.02")
+_VEGA_PER_UNIT = Decimal("0.1")
 
 
 class GreekCalculator:
@@ -432,19 +713,11 @@ class GreekCalculator:
             Delta value
         """
         if position.current_size == 0:
-            return Decimal("0")
+            return _ZERO
         
-        # Calculate P&L at current price
-        if position.side == PositionSide.LONG:
-            current_pnl = (current_price - position.entry_price) * position.current_size
-            up_pnl = ((current_price + price_range) - position.entry_price) * position.current_size
-        else:
-            current_pnl = (position.entry_price - current_price) * position.current_size
-            up_pnl = (position.entry_price - (current_price + price_range)) * position.current_size
-        
-        delta = (up_pnl - current_pnl) / price_range
-        
-        return delta.quantize(Decimal("0.01"))
+        # P&L is linear in price, so the finite difference over any
+        # price_range reduces to the signed size
+        return (position.side_sign * position.current_size).quantize(_PENNY)
         
     def calculate_gamma(
         self,
@@ -466,7 +739,7 @@ class GreekCalculator:
         """
         # For simple betting positions, gamma is typically 0
         # as delta is constant
-        return Decimal("0")
+        return _ZERO
         
     def calculate_theta(
         self,
@@ -488,7 +761,7 @@ class GreekCalculator:
             Theta value (P&L decay per hour)
         """
         if position.current_size == 0 or time_to_event <= 0:
-            return Decimal("0")
+            return _ZERO
         
         # Simple linear decay model
         hours_to_event = Decimal(time_to_event) / 60
@@ -503,7 +776,7 @@ class GreekCalculator:
         
         theta = -position.current_size * decay_rate * decay_multiplier
         
-        return theta.quantize(Decimal("0.01"))
+        return theta.quantize(_PENNY)
         
     def calculate_vega(
         self,
@@ -524,7 +797,7 @@ class GreekCalculator:
             Vega value
         """
         if position.current_size == 0:
-            return Decimal("0")
+            return _ZERO
         
         # Higher volatility generally benefits long gamma positions
         # For simple bets, we can model this as opportunity value
@@ -534,7 +807,7 @@ class GreekCalculator:
         if position.side == PositionSide.SHORT:
             vega = -vega  # Short positions lose from volatility
         
-        return vega.quantize(Decimal("0.01"))
+        return vega.quantize(_PENNY)
         
     def calculate_portfolio_greeks(
         self,
@@ -546,32 +819,45 @@ class GreekCalculator:
         
         Args:
             positions: List of positions
-            market_prices: Current prices by selection_id
+            market_prices: Current prices by selection_id (unused while
+                payoffs are linear; kept for interface stability)
             time_to_events: Time to event by market_id
             
         Returns:
             Dictionary of Greek values
         """
-        total_delta = Decimal("0")
-        total_gamma = Decimal("0")
-        total_theta = Decimal("0")
-        total_vega = Decimal("0")
-        
+        total_delta = _ZERO
+        total_theta = _ZERO
+        total_vega = _ZERO
+        
+        # One pass with the single-position formulas inlined. Payoffs are
+        # linear, so delta is the signed size whatever the current price
+        # and gamma is zero; each term is still quantized as the
+        # per-position methods do, so totals match summing them.
         for pos in positions:
-            if pos.current_size == 0:
+            size = pos.current_size
+            if size == 0:
                 continue
-                
-            current_price = market_prices.get(pos.selection_id, pos.entry_price)
+            
+            signed_size = size if pos.side == PositionSide.LONG else -size
             time_to_event = time_to_events.get(pos.market_id, 60)
             
-            total_delta += self.calculate_delta(pos, current_price)
-            total_gamma += self.calculate_gamma(pos, current_price)
-            total_theta += self.calculate_theta(pos, time_to_event)
-            total_vega += self.calculate_vega(pos, Decimal("0.05"))  # Assumed volatility
+            total_delta += signed_size.quantize(_PENNY)
+            
+            if time_to_event > 0:
+                if time_to_event < 60:
+                    theta_rate = _THETA_RATE_LAST_HOUR
+                elif time_to_event < 240:
+                    theta_rate = _THETA_RATE_NEAR
+                else:
+                    theta_rate = _THETA_RATE
+                total_theta += (-size * theta_rate).quantize(_PENNY)
+            
+            total_vega += (signed_size * _VEGA_PER_UNIT).quantize(_PENNY)
         
         return {
             "delta": total_delta,
-            "gamma": total_gamma,
+            "gamma": _ZERO,
             "theta": total_theta,
             "vega": total_vega
         }
\ No newline at end of file
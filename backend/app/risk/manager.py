@@ -1,7 +1,8 @@
 """Risk manager for enforcing limits and managing portfolio risk."""
 
 import asyncio
-from typing import Dict, List, Optional, Set, Tuple
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
 from enum import Enum
@@ -17,6 +18,10 @@ from app.trading.models import TradeInstruction, OrderSide, ExecutionStrategy
 
 logger = logging.getLogger(__name__)
 
+# Shared Decimal constants for the per-trade and per-tick checks
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+
 
 class RiskLimitType(str, Enum):
     """Types of risk limits."""
@@ -75,6 +80,8 @@ class RiskLimits:
 class RiskManager:
     """Manages portfolio risk and enforces limits."""
     
+    ALERT_HISTORY_SIZE = 100
+    
     def __init__(
         self,
         position_tracker: PositionTracker,
@@ -102,19 +109,27 @@ class RiskManager:
         # State tracking
         self.trading_frozen = False
         self.freeze_reason = None
-        self.daily_loss = Decimal("0")
+        self.daily_loss = _ZERO
         self.last_reset = datetime.now()
         
         # Breaches and alerts
         self.active_breaches: Set[str] = set()
-        self.alert_history: List[RiskAlert] = []
+        self.alert_history: Deque[RiskAlert] = deque(maxlen=self.ALERT_HISTORY_SIZE)
         self.alert_callbacks: List = []
         
+        # Last risk metrics and the state they were computed from
+        self._metrics_cache: Optional[Tuple[tuple, RiskMetrics]] = None
+        
         # Monitoring
         self.monitoring_task: Optional[asyncio.Task] = None
         
     async def start(self):
-        """Start risk monitoring."""
+        """Start risk monitoring.
+        
+        The monitoring task runs on the caller's event loop. Under the API
+        server that is uvicorn's loop, which is uvloop when installed
+        (uvicorn[standard] pulls it in and loop="auto" selects it).
+        """
         logger.info("Starting risk manager")
         self.monitoring_task = asyncio.create_task(self._monitoring_loop())
         
@@ -175,22 +190,14 @@ class RiskManager:
             return False, f"Total exposure would exceed limit: {total_exposure + required_balance} > {self.limits.max_total_exposure}"
         
         # Check number of positions
-        open_positions = self.tracker.get_open_positions()
-        if len(open_positions) >= self.limits.max_open_positions:
-            # Check if this is adding to existing position
-            existing = False
-            for pos in open_positions:
-                if (pos.market_id == instruction.market_id and 
-                    pos.selection_id == instruction.selection_id):
-                    existing = True
-                    break
-            
-            if not existing:
+        if len(self.tracker.live_positions) >= self.limits.max_open_positions:
+            # Adding to an existing position is still allowed
+            if not self.tracker.has_position(instruction.market_id, instruction.selection_id):
                 return False, f"Maximum open positions reached: {self.limits.max_open_positions}"
         
         # Check concentration
         if total_exposure > 0:
-            concentration = (market_exposure.max_loss if market_exposure else Decimal("0")) / total_exposure
+            concentration = (market_exposure.max_loss if market_exposure else _ZERO) / total_exposure
             if concentration > self.limits.max_concentration:
                 return False, f"Position concentration too high: {concentration} > {self.limits.max_concentration}"
         
@@ -203,7 +210,7 @@ class RiskManager:
             position: Updated position
         """
         # Update daily P&L
-        self.daily_loss = -min(Decimal("0"), position.realized_pnl)
+        self.daily_loss = -min(_ZERO, position.realized_pnl)
         
         # Check for limit breaches
         await self._check_limits()
@@ -228,9 +235,10 @@ class RiskManager:
         self.freeze_reason = reason
         
         # Create critical alert
+        now = datetime.now()
         alert = RiskAlert(
-            alert_id=f"kill_switch_{datetime.now().timestamp()}",
-            timestamp=datetime.now(),
+            alert_id=f"kill_switch_{now.timestamp()}",
+            timestamp=now,
             severity="critical",
             category="kill_switch",
             message=f"Kill switch activated: {reason}",
@@ -243,43 +251,65 @@ class RiskManager:
         # Optionally close all positions
         # await self._close_all_positions()
         
-    async def reset_daily_limits(self):
-        """Reset daily limits (call at start of trading day)."""
-        self.daily_loss = Decimal("0")
-        self.last_reset = datetime.now()
+    async def reset_daily_limits(self, now: Optional[datetime] = None):
+        """Reset daily limits (call at start of trading day).
+        
+        Args:
+            now: Reset time (defaults to the current time)
+        """
+        self.daily_loss = _ZERO
+        self.last_reset = now or datetime.now()
         logger.info("Daily risk limits reset")
         
-    def get_risk_metrics(self) -> RiskMetrics:
+    def get_risk_metrics(
+        self,
+        positions: Optional[List[Position]] = None,
+        total_exposure: Optional[Decimal] = None
+    ) -> RiskMetrics:
         """Get current risk metrics.
         
+        Metrics are reused until the tracker version, daily loss or limits
+        change, so snapshots passed in must be the tracker's current state.
+        Each call returns its own copy, stamped with the time of the call.
+        
+        Args:
+            positions: Open positions snapshot (fetched from the tracker if None)
+            total_exposure: Total exposure snapshot (fetched from the tracker if None)
+            
         Returns:
             Current risk metrics
         """
-        positions = self.tracker.get_open_positions()
-        total_exposure = self.tracker.get_total_exposure()
+        cache_key = (
+            self.tracker.version,
+            self.daily_loss,
+            self.limits.max_total_exposure,
+            self.limits.max_open_positions,
+            self.limits.max_daily_loss
+        )
+        if self._metrics_cache is not None and self._metrics_cache[0] == cache_key:
+            return self._copy_metrics(self._metrics_cache[1], datetime.now())
         
-        # Calculate metrics
+        if positions is None:
+            positions = self.tracker.get_open_positions()
+        if total_exposure is None:
+            total_exposure = self.tracker.get_total_exposure()
+        
+        # Calculate metrics in one pass over the positions
         num_positions = len(positions)
-        num_markets = len(set(pos.market_id for pos in positions))
+        largest_position = _ZERO
+        expected_value = _ZERO
+        market_exposures: Dict[str, Decimal] = defaultdict(Decimal)
         
-        largest_position = max(
-            (pos.current_size for pos in positions),
-            default=Decimal("0")
-        )
+        for pos in positions:
+            if pos.current_size > largest_position:
+                largest_position = pos.current_size
+            expected_value += pos.unrealized_pnl
+            market_exposures[pos.market_id] += pos.current_size
+        
+        num_markets = len(market_exposures)
         
         # Calculate concentration
-        if total_exposure > 0 and positions:
-            market_exposures = {}
-            for pos in positions:
-                market_id = pos.market_id
-                if market_id not in market_exposures:
-                    market_exposures[market_id] = Decimal("0")
-                market_exposures[market_id] += pos.current_size
-            
-            max_market_exposure = max(market_exposures.values())
-            concentration = max_market_exposure / total_exposure
-        else:
-            concentration = Decimal("0")
+        concentration = self._compute_concentration(market_exposures, total_exposure)
         
         # Calculate Greeks
         market_prices = {}  # Would get from provider
@@ -292,17 +322,17 @@ class RiskManager:
         # Calculate limit usage
         exposure_limit_used = (
             (total_exposure / self.limits.max_total_exposure * 100)
-            if self.limits.max_total_exposure > 0 else Decimal("0")
+            if self.limits.max_total_exposure > 0 else _ZERO
         )
         
         position_limit_used = (
             (Decimal(num_positions) / Decimal(self.limits.max_open_positions) * 100)
-            if self.limits.max_open_positions > 0 else Decimal("0")
+            if self.limits.max_open_positions > 0 else _ZERO
         )
         
         loss_limit_used = (
             (self.daily_loss / self.limits.max_daily_loss * 100)
-            if self.limits.max_daily_loss > 0 else Decimal("0")
+            if self.limits.max_daily_loss > 0 else _ZERO
         )
         
         # Calculate risk score (0-100)
@@ -322,26 +352,29 @@ class RiskManager:
         if concentration > Decimal("0.5"):
             alerts.append(f"High concentration risk: {concentration:.1%}")
         
-        return RiskMetrics(
+        metrics = RiskMetrics(
             timestamp=datetime.now(),
             total_exposure=total_exposure,
             max_drawdown=self.daily_loss,
             var_95=total_exposure * Decimal("0.1"),  # Simplified VaR
-            expected_value=sum(pos.unrealized_pnl for pos in positions),
+            expected_value=expected_value,
             num_open_positions=num_positions,
             num_markets=num_markets,
             largest_position=largest_position,
             concentration_risk=concentration,
-            portfolio_delta=greeks.get("delta", Decimal("0")),
-            portfolio_gamma=greeks.get("gamma", Decimal("0")),
-            portfolio_theta=greeks.get("theta", Decimal("0")),
+            portfolio_delta=greeks.get("delta", _ZERO),
+            portfolio_gamma=greeks.get("gamma", _ZERO),
+            portfolio_theta=greeks.get("theta", _ZERO),
             exposure_limit_used=exposure_limit_used,
             position_limit_used=position_limit_used,
             loss_limit_used=loss_limit_used,
-            risk_score=min(risk_score, Decimal("100")),
+            risk_score=min(risk_score, _HUNDRED),
             alerts=alerts
         )
         
+        self._metrics_cache = (cache_key, self._copy_metrics(metrics, metrics.timestamp))
+        return metrics
+        
     def get_exposure_report(self, account_balance: Decimal) -> ExposureReport:
         """Get comprehensive exposure report.
         
@@ -351,17 +384,18 @@ class RiskManager:
         Returns:
             Exposure report
         """
-        # Get market exposures
+        # Snapshot tracker state once for the whole report
         market_exposures = list(self.tracker.market_exposures.values())
+        open_positions = self.tracker.get_open_positions()
+        total_exposure = self.tracker.get_total_exposure()
         
         # Get risk metrics
-        risk_metrics = self.get_risk_metrics()
+        risk_metrics = self.get_risk_metrics(open_positions, total_exposure)
         
         # Get P&L statement
         pnl_statement = self.tracker.get_pnl_statement(period_hours=24)
         
         # Calculate totals
-        total_exposure = self.tracker.get_total_exposure()
         total_liability = sum(
             exp.net_lay_liability for exp in market_exposures
         )
@@ -373,7 +407,7 @@ class RiskManager:
         # Calculate open P&L
         open_pnl = sum(
             pos.unrealized_pnl 
-            for pos in self.tracker.get_open_positions()
+            for pos in open_positions
         )
         
         # Available balance
@@ -407,15 +441,47 @@ class RiskManager:
             daily_pnl=pnl_statement,
             open_pnl=open_pnl,
             exposure_limit=self.limits.max_total_exposure,
-            exposure_limit_remaining=max(Decimal("0"), exposure_remaining),
+            exposure_limit_remaining=max(_ZERO, exposure_remaining),
             daily_loss_limit=self.limits.max_daily_loss,
-            daily_loss_limit_remaining=max(Decimal("0"), loss_remaining),
+            daily_loss_limit_remaining=max(_ZERO, loss_remaining),
             warnings=warnings,
             breaches=breaches
         )
         
     # Private methods
     
+    @staticmethod
+    def _copy_metrics(metrics: RiskMetrics, timestamp: datetime) -> RiskMetrics:
+        """Copy metrics with a new timestamp.
+        
+        All other fields are immutable values except the alerts list,
+        which is copied so callers never share it.
+        
+        Args:
+            metrics: Metrics to copy
+            timestamp: Timestamp for the copy
+            
+        Returns:
+            Independent copy of the metrics
+        """
+        return metrics.model_copy(update={"timestamp": timestamp, "alerts": list(metrics.alerts)})
+        
+    @staticmethod
+    def _compute_concentration(market_exposures: Dict[str, Decimal], total_exposure: Decimal) -> Decimal:
+        """Share of total exposure held in the largest market (0-1).
+        
+        Args:
+            market_exposures: Open size by market ID
+            total_exposure: Total portfolio exposure
+            
+        Returns:
+            Concentration ratio
+        """
+        if total_exposure <= 0 or not market_exposures:
+            return _ZERO
+        
+        return max(market_exposures.values()) / total_exposure
+        
     async def _check_limits(self):
         """Check all risk limits and trigger alerts."""
         breaches = set()
@@ -443,8 +509,8 @@ class RiskManager:
             if self.daily_loss > self.limits.max_daily_loss * Decimal("1.2"):
                 await self.trigger_kill_switch(f"Daily loss exceeded 120% of limit: {self.daily_loss}")
         
-        # Check number of positions
-        num_positions = len(self.tracker.get_open_positions())
+        # Check number of positions (count the live index, no list copy)
+        num_positions = len(self.tracker.live_positions)
         if num_positions > self.limits.max_open_positions:
             breaches.add("open_positions")
             await self._handle_breach(
@@ -483,9 +549,10 @@ class RiskManager:
             action = RiskAction.REDUCE_POSITION
         
         # Create alert
+        now = datetime.now()
         alert = RiskAlert(
-            alert_id=f"{limit_type}_{datetime.now().timestamp()}",
-            timestamp=datetime.now(),
+            alert_id=f"{limit_type}_{now.timestamp()}",
+            timestamp=now,
             severity=severity,
             category="limit_breach",
             message=f"{limit_type} breached: {current_value} > {limit_value}",
@@ -518,9 +585,10 @@ class RiskManager:
         
         if hedge and hedge.urgency in ["high", "critical"]:
             # Create alert
+            now = datetime.now()
             alert = RiskAlert(
-                alert_id=f"hedge_{datetime.now().timestamp()}",
-                timestamp=datetime.now(),
+                alert_id=f"hedge_{now.timestamp()}",
+                timestamp=now,
                 severity="warning" if hedge.urgency == "high" else "critical",
                 category="hedging",
                 message=f"Hedging recommended: {hedge.reason}",
@@ -554,18 +622,27 @@ class RiskManager:
         Args:
             alert: Alert to send
         """
+        # Bounded deque keeps only the most recent alerts
         self.alert_history.append(alert)
         
-        # Keep only last 100 alerts
-        if len(self.alert_history) > 100:
-            self.alert_history = self.alert_history[-100:]
+        # Send to callbacks concurrently so a slow one doesn't delay the rest
+        if self.alert_callbacks:
+            await asyncio.gather(*(
+                self._run_alert_callback(callback, alert)
+                for callback in self.alert_callbacks
+            ))
         
-        # Send to callbacks
-        for callback in self.alert_callbacks:
-            try:
-                await callback(alert)
-            except Exception as e:
-                logger.error(f"Alert callback failed: {e}")
+    async def _run_alert_callback(self, callback, alert: RiskAlert):
+        """Run one alert callback, logging any failure.
+        
+        Args:
+            callback: Async alert callback
+            alert: Alert to send
+        """
+        try:
+            await callback(alert)
+        except Exception as e:
+            logger.error(f"Alert callback failed: {e}")
                 
     async def _monitoring_loop(self):
         """Background monitoring loop."""
@@ -577,8 +654,9 @@ class RiskManager:
                 await self._check_limits()
                 
                 # Reset daily limits if needed
-                if datetime.now().date() > self.last_reset.date():
-                    await self.reset_daily_limits()
+                now = datetime.now()
+                if now.date() > self.last_reset.date():
+                    await self.reset_daily_limits(now)
                     
             except asyncio.CancelledError:
                 break
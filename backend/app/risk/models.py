@@ -20,6 +20,10 @@ class PositionSide(str, Enum):
     SHORT = "short"  # Lay bet
 
 
+# Direction of P&L for each side (enum values are stored as strings)
+_SIDE_SIGN = {PositionSide.LONG: 1, PositionSide.SHORT: -1}
+
+
 class Position(BaseModel):
     """Individual position in a market."""
     position_id: str = Field(..., description="Unique position identifier")
@@ -53,6 +57,11 @@ class Position(BaseModel):
     
     class Config:
         use_enum_values = True
+    
+    @property
+    def side_sign(self) -> int:
+        """+1 for a long (back) position, -1 for a short (lay) position."""
+        return _SIDE_SIGN[self.side]
 
 
 class MarketExposure(BaseModel):
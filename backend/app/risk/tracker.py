@@ -34,6 +34,9 @@ class PositionTracker:
         self.positions: Dict[str, Position] = {}  # position_id -> Position
         self.market_positions: Dict[str, List[str]] = defaultdict(list)  # market_id -> [position_ids]
         self.selection_positions: Dict[Tuple[str, str], List[str]] = defaultdict(list)  # (market_id, selection_id) -> [position_ids]
+        self.live_positions: Dict[str, Position] = {}  # position_id -> Position not yet closed
+        self.live_selections: Dict[Tuple[str, str], int] = {}  # (market_id, selection_id) -> live position count
+        self.version: int = 0  # Bumped on every position/exposure change
         
         # Order tracking
         self.order_to_position: Dict[str, str] = {}  # order_id -> position_id
@@ -199,6 +202,11 @@ class PositionTracker:
         # Update status
         if position.current_size == 0:
             position.status = PositionStatus.CLOSED
+            if self.live_positions.pop(position_id, None) is not None:
+                key = (position.market_id, position.selection_id)
+                self.live_selections[key] -= 1
+                if not self.live_selections[key]:
+                    del self.live_selections[key]
         else:
             position.status = PositionStatus.PARTIALLY_CLOSED
         
@@ -246,6 +254,7 @@ class PositionTracker:
                 position.unrealized_pnl *= Decimal("0.98")  # 2% commission
         
         position.last_update = datetime.now()
+        self.version += 1
         
     def get_position(self, position_id: str) -> Optional[Position]:
         """Get position by ID."""
@@ -253,10 +262,7 @@ class PositionTracker:
         
     def get_open_positions(self) -> List[Position]:
         """Get all open positions."""
-        return [
-            pos for pos in self.positions.values()
-            if pos.status != PositionStatus.CLOSED
-        ]
+        return list(self.live_positions.values())
         
     def get_market_positions(self, market_id: str) -> List[Position]:
         """Get all positions for a market."""
@@ -268,6 +274,10 @@ class PositionTracker:
         position_ids = self.selection_positions.get((market_id, selection_id), [])
         return [self.positions[pid] for pid in position_ids if pid in self.positions]
         
+    def has_position(self, market_id: str, selection_id: str) -> bool:
+        """Check whether a selection has any open position."""
+        return (market_id, selection_id) in self.live_selections
+        
     def get_net_position(self, market_id: str, selection_id: str) -> Tuple[Decimal, Decimal]:
         """Get net position for a selection.
         
@@ -451,6 +461,9 @@ class PositionTracker:
         
         # Store position
         self.positions[position_id] = position
+        self.live_positions[position_id] = position
+        key = (market_id, selection_id)
+        self.live_selections[key] = self.live_selections.get(key, 0) + 1
         self.market_positions[market_id].append(position_id)
         self.selection_positions[(market_id, selection_id)].append(position_id)
         
@@ -557,6 +570,7 @@ class PositionTracker:
         self.total_exposure = sum(
             exp.max_loss for exp in self.market_exposures.values()
         )
+        self.version += 1
         
     async def _trigger_position_update(
         self,
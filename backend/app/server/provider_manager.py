@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from collections import defaultdict
 
-from ..providers.base import BaseDataProvider
+from ..providers.base import BaseDataProvider, KeepAliveScheduler
 from ..providers.factory import DataProviderFactory
 from ..providers.tennis_models import TennisMatch, TennisScore, MatchStatistics
 from ..services.tennis_scores_service import TennisScoresService
@@ -52,6 +52,8 @@ class ProviderInfo:
 class ProviderManager:
     """Manages multiple data providers with failover support."""
     
+    KEEP_ALIVE_INTERVAL = 600  # Seconds between session keep-alives
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         """
         Initialize provider manager.
@@ -69,6 +71,7 @@ class ProviderManager:
         self._lock = asyncio.Lock()
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
+        self._keep_alive = KeepAliveScheduler(self.logger)
         
     async def initialize(self, enabled_providers: List[str], primary_provider: str):
         """
@@ -154,6 +157,12 @@ class ProviderManager:
         results = await asyncio.gather(*tasks, return_exceptions=True)
         connected = sum(1 for r in results if r is True)
         self.logger.info(f"Connected to {connected}/{len(self.providers)} providers")
+        
+        # One scheduler keeps every provider's session alive
+        self._keep_alive.start(
+            [info.provider for info in self.providers.values()],
+            interval=self.KEEP_ALIVE_INTERVAL
+        )
     
     async def disconnect_provider(self, provider_name: str):
         """
@@ -184,6 +193,8 @@ class ProviderManager:
     
     async def disconnect_all(self):
         """Disconnect from all providers."""
+        self._keep_alive.stop()
+        
         tasks = []
         for provider_name in self.providers:
             tasks.append(self.disconnect_provider(provider_name))
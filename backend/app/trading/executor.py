@@ -238,18 +238,20 @@ class TradeExecutor:
         if not provider_info or not provider_info.service:
             raise ValueError(f"Provider {provider} not available")
         
-        service = provider_info.service
+        # Trading calls go to the provider itself; concurrent orders on the
+        # same market can then share one placeOrders request
+        provider_client = provider_info.provider
         
         # Place order based on side
         if instruction.side == OrderSide.BACK:
-            return service.place_back_bet(
+            return await provider_client.aplace_back_bet(
                 market_id=instruction.market_id,
                 selection_id=instruction.selection_id,
                 price=float(instruction.price),
                 size=float(instruction.size)
             )
         else:  # LAY
-            return service.place_lay_bet(
+            return await provider_client.aplace_lay_bet(
                 market_id=instruction.market_id,
                 selection_id=instruction.selection_id,
                 price=float(instruction.price),
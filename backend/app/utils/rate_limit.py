@@ -0,0 +1,62 @@
+"""Token bucket rate limiter."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `burst`;
+    each call spends tokens and blocks until enough are available.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        """
+        Initialize bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, weight: float = 1.0) -> float:
+        """
+        Take tokens, waiting for them to refill if needed.
+
+        Args:
+            weight: Tokens to take (capped at burst)
+
+        Returns:
+            Seconds spent waiting
+        """
+        weight = min(weight, self.burst)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= weight:
+                        self._tokens -= weight
+                        return waited
+                    wait = (weight - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every acquire for the given number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
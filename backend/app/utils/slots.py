@@ -0,0 +1,53 @@
+"""Helpers for slotted dataclasses."""
+
+from dataclasses import fields, is_dataclass
+
+
+def add_slots(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+    
+    Equivalent to dataclass(slots=True), which needs Python 3.10+.
+    Instances lose their __dict__, cutting per-object memory.
+    
+    Args:
+        cls: Dataclass to rebuild
+        
+    Returns:
+        New slotted class with the same name, bases and methods
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+    if "__slots__" in cls.__dict__:
+        return cls
+    
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    
+    # Defaults live in __init__; class attributes would clash with the slots
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    
+    # Frozen instances can't be restored by setattr (copy/pickle), so
+    # give them the same state hooks dataclass(slots=True) adds
+    if cls.__dataclass_params__.frozen:
+        cls_dict.setdefault("__getstate__", _frozen_getstate)
+        cls_dict.setdefault("__setstate__", _frozen_setstate)
+    
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def _frozen_getstate(self):
+    """Field values in declaration order."""
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _frozen_setstate(self, state):
+    """Restore field values, bypassing the frozen __setattr__."""
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
@@ -0,0 +1,13 @@
+"""Integer nanosecond timestamps for hot-path models."""
+
+from datetime import datetime
+
+
+def ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() stamp to a local naive datetime."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to a time.time_ns()-style stamp."""
+    return round(value.timestamp() * 1e6) * 1000
@@ -220,6 +220,16 @@ async def test_risk_system():
     print(f"  Delta: {delta}")
     print(f"  Theta: {theta}")
     
+    # Analytic delta must match the finite difference it replaced
+    step = Decimal("0.02")
+    side_sign = 1 if position1.side == PositionSide.LONG else -1
+    for price in (Decimal("1.5"), Decimal("2.8"), Decimal("10")):
+        pnl_now = side_sign * (price - position1.entry_price) * position1.current_size
+        pnl_up = side_sign * (price + step - position1.entry_price) * position1.current_size
+        finite_delta = ((pnl_up - pnl_now) / step).quantize(Decimal("0.01"))
+        assert greek_calc.calculate_delta(position1, price) == finite_delta
+    print(f"✅ Delta matches finite difference")
+    
     # Test 8: Hedge Calculation
     print("\n" + "=" * 60)
     print("TEST 8: Hedge Requirements")
@@ -0,0 +1,87 @@
+"""Tests for the settled bet cache behind BetfairProvider.get_matched_bets."""
+
+import pytest
+
+from app.providers import betfair
+from app.providers.betfair import BetfairProvider
+
+
+def _order(bet_id, settled, market_id="1.1"):
+    return {"betId": bet_id, "marketId": market_id, "settledDate": settled, "profit": 1.0}
+
+
+@pytest.fixture
+def provider(monkeypatch, tmp_path):
+    """Authenticated provider serving listClearedOrders from a script."""
+    cert_file = tmp_path / "client.pem"
+    cert_file.write_text("")
+    monkeypatch.setenv("BETFAIR_USERNAME", "user")
+    monkeypatch.setenv("BETFAIR_PASSWORD", "pass")
+    monkeypatch.setenv("BETFAIR_APP_KEY", "key")
+    monkeypatch.setenv("BETFAIR_CERT_FILE", str(cert_file))
+
+    provider = BetfairProvider()
+    provider.is_authenticated = True
+    provider.pages = []
+    provider.calls = []
+
+    def list_cleared_orders(bet_status, from_record=0, **kwargs):
+        provider.calls.append((from_record, kwargs.get("settled_date_range")))
+        return provider.pages.pop(0)
+
+    monkeypatch.setattr(provider.client.betting, "list_cleared_orders", list_cleared_orders)
+    return provider
+
+
+def test_pages_then_fetches_from_watermark(provider):
+    provider.pages = [
+        {"clearedOrders": [_order("1", "2024-01-01T10:00:00Z"), _order("2", "2024-01-01T11:00:00Z")],
+         "moreAvailable": True},
+        {"clearedOrders": [_order("3", "2024-01-01T12:00:00Z")], "moreAvailable": False},
+    ]
+
+    first = provider.get_matched_bets()
+
+    assert [bet["bet_id"] for bet in first] == ["1", "2", "3"]
+    assert provider.calls == [(0, None), (2, None)]
+
+    # The range start is inclusive, so bet 3 comes back and must not repeat
+    provider.pages = [
+        {"clearedOrders": [_order("3", "2024-01-01T12:00:00Z"), _order("4", "2024-01-01T13:00:00Z")],
+         "moreAvailable": False},
+    ]
+
+    second = provider.get_matched_bets()
+
+    assert [bet["bet_id"] for bet in second] == ["1", "2", "3", "4"]
+    from_record, date_range = provider.calls[-1]
+    assert from_record == 0
+    assert date_range["from"] == "2024-01-01T12:00:00Z"
+
+
+def test_market_filters_are_evicted_least_recently_used(provider, monkeypatch):
+    monkeypatch.setattr(BetfairProvider, "CLEARED_CACHE_MAX_SIZE", 2)
+    for market_id in ("1.1", "1.2", "1.1", "1.3"):
+        provider.pages.append({
+            "clearedOrders": [_order(market_id, "2024-01-01T10:00:00Z", market_id)],
+            "moreAvailable": False
+        })
+        provider.get_matched_bets(market_id)
+
+    assert list(provider._cleared_cache) == ["1.1", "1.3"]
+
+
+def test_rows_are_refetched_in_full_after_ttl(provider, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(betfair.time, "monotonic", lambda: now[0])
+    provider.pages = [
+        {"clearedOrders": [_order("1", "2024-01-01T10:00:00Z")], "moreAvailable": False},
+        {"clearedOrders": [_order("2", "2024-01-01T11:00:00Z")], "moreAvailable": False},
+    ]
+    provider.get_matched_bets()
+
+    now[0] += BetfairProvider.CLEARED_CACHE_TTL + 1
+    bets = provider.get_matched_bets()
+
+    assert [bet["bet_id"] for bet in bets] == ["2"]
+    assert provider.calls[-1] == (0, None)
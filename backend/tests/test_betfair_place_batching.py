@@ -0,0 +1,154 @@
+"""Tests for batched async bet placement on the Betfair provider."""
+
+import asyncio
+
+import pytest
+
+from app.providers.betfair import BetfairProvider
+
+
+@pytest.fixture
+def provider(monkeypatch, tmp_path):
+    """Authenticated provider whose placeOrders calls are recorded."""
+    cert_file = tmp_path / "client.pem"
+    cert_file.write_text("")
+    monkeypatch.setenv("BETFAIR_USERNAME", "user")
+    monkeypatch.setenv("BETFAIR_PASSWORD", "pass")
+    monkeypatch.setenv("BETFAIR_APP_KEY", "key")
+    monkeypatch.setenv("BETFAIR_CERT_FILE", str(cert_file))
+
+    provider = BetfairProvider()
+    provider.is_authenticated = True
+    provider.place_calls = []
+
+    def place_orders(market_id, instructions, **kwargs):
+        provider.place_calls.append((market_id, list(instructions)))
+        return {
+            "status": "SUCCESS",
+            "instructionReports": [
+                {
+                    "status": "SUCCESS",
+                    "betId": f"{market_id}:{instruction['selectionId']}:{instruction['limitOrder']['price']}",
+                    "sizeMatched": 0
+                }
+                for instruction in instructions
+            ]
+        }
+
+    monkeypatch.setattr(provider.client.betting, "place_orders", place_orders)
+    return provider
+
+
+async def _place_burst(provider, bets):
+    """Place (market_id, selection_id, price) bets concurrently."""
+    return await asyncio.gather(*(
+        provider.aplace_back_bet(market_id, selection_id, price, 2.0)
+        for market_id, selection_id, price in bets
+    ))
+
+
+def test_burst_is_one_place_orders_call_per_market(provider):
+    bets = [
+        ("1.1", "101", 2.0),
+        ("1.2", "201", 3.5),
+        ("1.1", "102", 2.5),
+        ("1.1", "103", 4.0),
+        ("1.2", "202", 1.5),
+    ]
+
+    results = asyncio.run(_place_burst(provider, bets))
+
+    assert sorted(market_id for market_id, _ in provider.place_calls) == ["1.1", "1.2"]
+    by_market = dict(provider.place_calls)
+    assert [i["selectionId"] for i in by_market["1.1"]] == ["101", "102", "103"]
+    assert [i["selectionId"] for i in by_market["1.2"]] == ["201", "202"]
+
+    # Each caller gets the report for its own instruction
+    for (market_id, selection_id, price), result in zip(bets, results):
+        assert result["success"] is True
+        assert result["bet_id"] == f"{market_id}:{selection_id}:{price}"
+
+
+def test_batches_split_at_place_batch_max(provider, monkeypatch):
+    monkeypatch.setattr(BetfairProvider, "PLACE_BATCH_MAX", 2)
+    bets = [("1.1", str(selection_id), 2.0) for selection_id in range(5)]
+
+    results = asyncio.run(_place_burst(provider, bets))
+
+    assert [len(instructions) for _, instructions in provider.place_calls] == [2, 2, 1]
+    assert [result["bet_id"] for result in results] == [f"1.1:{i}:2.0" for i in range(5)]
+
+
+def test_place_orders_failure_resolves_every_caller(provider, monkeypatch):
+    def place_orders(market_id, instructions, **kwargs):
+        raise ConnectionError("connection reset")
+
+    monkeypatch.setattr(provider.client.betting, "place_orders", place_orders)
+    bets = [("1.1", "101", 2.0), ("1.1", "102", 2.0), ("1.2", "201", 2.0)]
+
+    async def place():
+        return await asyncio.wait_for(_place_burst(provider, bets), timeout=5)
+
+    results = asyncio.run(place())
+
+    assert results == [{"success": False, "error": "connection reset"}] * 3
+    assert not provider._place_tasks
+
+
+def test_malformed_report_resolves_every_caller(provider, monkeypatch):
+    monkeypatch.setattr(
+        provider.client.betting, "place_orders",
+        lambda market_id, instructions, **kwargs: None
+    )
+
+    async def place():
+        return await asyncio.wait_for(_place_burst(provider, [("1.1", "101", 2.0)]), timeout=5)
+
+    [result] = asyncio.run(place())
+
+    assert result["success"] is False
+
+
+def test_invalid_bet_returns_failure_without_queueing(provider):
+    result = asyncio.run(provider.aplace_back_bet("1.1", "101", 2.0, None))
+
+    assert result["success"] is False
+    assert provider.place_calls == []
+
+
+def test_flush_timer_from_closed_loop_is_replaced(provider):
+    async def abandoned_burst():
+        # asyncio.run closes the loop before the flush timer fires
+        asyncio.get_running_loop().create_task(provider.aplace_back_bet("1.1", "101", 2.0, 2.0))
+        await asyncio.sleep(0)
+
+    asyncio.run(abandoned_burst())
+    assert provider._flush_task is not None
+
+    async def place():
+        return await asyncio.wait_for(provider.aplace_back_bet("1.2", "201", 3.0, 2.0), timeout=5)
+
+    result = asyncio.run(place())
+
+    assert result["bet_id"] == "1.2:201:3.0"
+    assert [market_id for market_id, _ in provider.place_calls] == ["1.2"]
+
+
+def test_bets_queued_on_stopped_loop_are_failed(provider):
+    old_loop = asyncio.new_event_loop()
+    try:
+        async def start_place():
+            task = asyncio.get_running_loop().create_task(provider.aplace_back_bet("1.1", "101", 2.0, 2.0))
+            await asyncio.sleep(0)
+            return task
+
+        stale = old_loop.run_until_complete(start_place())
+
+        async def place():
+            return await asyncio.wait_for(provider.aplace_back_bet("1.2", "201", 3.0, 2.0), timeout=5)
+
+        assert asyncio.run(place())["success"] is True
+        assert old_loop.run_until_complete(stale)["success"] is False
+        assert [market_id for market_id, _ in provider.place_calls] == ["1.2"]
+    finally:
+        old_loop.close()
@@ -0,0 +1,123 @@
+"""Tests for coalesced market updates on the Betfair stream client."""
+
+import pytest
+
+from app.providers.betfair_stream import BetfairStreamClient
+from app.providers.models import MessageType
+
+
+@pytest.fixture
+def client():
+    """Stream client with a callback set but no connection."""
+    client = BetfairStreamClient("token", "key", "client.pem")
+    client._callback = lambda message: None
+    return client
+
+
+def _drain(client):
+    """Messages queued for the callback, in order."""
+    messages = []
+    while not client._out_queue.empty():
+        messages.append(client._out_queue.get_nowait())
+    return messages
+
+
+def _market_change(market_id, **runner_change):
+    runner_change.setdefault("id", 101)
+    return {"op": "mcm", "mc": [{"id": market_id, "rc": [runner_change]}]}
+
+
+def test_coalescing_is_on_by_default_and_holds_updates(client):
+    assert client.config.coalesce_ms
+
+    client._handle_market_change(_market_change("1.1", ltp=2.0))
+
+    assert _drain(client) == []
+    client._flush_pending_prices()
+    [message] = _drain(client)
+    assert message.market_id == "1.1"
+    assert message.data.get_runner("101").last_traded_price == 2.0
+
+
+def test_merge_scalars_are_last_write_wins(client):
+    client._update_market_definition("1.1", {
+        "name": "Match Odds", "inPlay": False, "runners": [{"id": 101, "name": "Player A"}]
+    })
+    client._handle_market_change(_market_change("1.1", ltp=2.0, tv=100.0))
+    client._update_market_definition("1.1", {
+        "name": "Match Odds", "inPlay": True, "runners": [{"id": 101, "name": "Player A"}]
+    })
+    client._handle_market_change(_market_change("1.1", ltp=2.2, tv=150.0))
+
+    client._flush_pending_prices()
+    [message] = _drain(client)
+    market_prices = message.data
+    runner = market_prices.get_runner("101")
+    assert market_prices.in_play is True
+    assert runner.runner_name == "Player A"
+    assert runner.last_traded_price == 2.2
+    assert runner.total_matched == 150.0
+
+
+def test_merge_keeps_ladder_unless_update_carries_one(client):
+    client._handle_market_change(_market_change("1.1", atb=[[2.0, 10.0]], atl=[[2.1, 5.0]]))
+    client._handle_market_change(_market_change("1.1", ltp=2.04))
+    client._handle_market_change(_market_change("1.1", atl=[[2.08, 7.0]]))
+
+    client._flush_pending_prices()
+    [message] = _drain(client)
+    runner = message.data.get_runner("101")
+    assert [(level.price, level.volume) for level in runner.back_prices] == [(2.0, 10.0)]
+    assert [(level.price, level.volume) for level in runner.lay_prices] == [(2.08, 7.0)]
+    assert runner.last_traded_price == 2.04
+
+
+def test_merge_appends_new_runner(client):
+    client._handle_market_change(_market_change("1.1", id=101, ltp=2.0))
+    client._handle_market_change(_market_change("1.1", id=102, ltp=1.9))
+
+    client._flush_pending_prices()
+    [message] = _drain(client)
+    assert [runner.runner_id for runner in message.data.runners] == ["101", "102"]
+
+
+@pytest.mark.parametrize("num_markets, shapes", [
+    (1, [1]),
+    (3, [3]),
+    (4, [3, 1]),
+    (6, [3, 3]),
+    (7, [3, 3, 1]),
+])
+def test_flush_batch_shape_at_batch_size_boundaries(client, num_markets, shapes):
+    client.config.batch_size = 3
+    market_ids = [f"1.{i}" for i in range(num_markets)]
+    for market_id in market_ids:
+        client._handle_market_change(_market_change(market_id, ltp=2.0))
+
+    client._flush_pending_prices()
+    messages = _drain(client)
+
+    assert [len(m.data) if isinstance(m.data, list) else 1 for m in messages] == shapes
+    delivered = []
+    for message in messages:
+        assert message.type == MessageType.MARKET_CHANGE
+        if isinstance(message.data, list):
+            # Batches carry a list of markets and no single market_id
+            assert message.market_id is None
+            assert len(message.raw_message) == len(message.data)
+            delivered.extend(market_prices.market_id for market_prices in message.data)
+        else:
+            assert message.market_id == message.data.market_id
+            delivered.append(message.market_id)
+    assert delivered == market_ids
+
+
+def test_coalescing_disabled_emits_each_update(client):
+    client.config.coalesce_ms = 0
+
+    client._handle_market_change(_market_change("1.1", ltp=2.0))
+    client._handle_market_change(_market_change("1.1", ltp=2.2))
+
+    messages = _drain(client)
+    assert [m.data.get_runner("101").last_traded_price for m in messages] == [2.0, 2.2]
+    assert not client._pending_prices
@@ -0,0 +1,65 @@
+"""Tests for parsing raw stream frames on the Betfair provider."""
+
+import orjson
+import pytest
+
+from app.providers.betfair import BetfairProvider
+from app.providers.betfair_stream import BetfairStreamClient
+from app.providers.models import MessageType
+
+
+@pytest.fixture
+def provider(monkeypatch, tmp_path):
+    """Provider with no stream client connected."""
+    cert_file = tmp_path / "client.pem"
+    cert_file.write_text("")
+    monkeypatch.setenv("BETFAIR_USERNAME", "user")
+    monkeypatch.setenv("BETFAIR_PASSWORD", "pass")
+    monkeypatch.setenv("BETFAIR_APP_KEY", "key")
+    monkeypatch.setenv("BETFAIR_CERT_FILE", str(cert_file))
+    return BetfairProvider()
+
+
+def _frame(*market_changes):
+    return orjson.dumps({"op": "mcm", "mc": list(market_changes)})
+
+
+def test_two_market_frame_returns_batch_without_client(provider):
+    assert provider.stream_client is None
+    frame = _frame(
+        {"id": "1.1", "rc": [{"id": 101, "ltp": 2.0, "atb": [[1.99, 10.0]]}]},
+        {"id": "1.2", "rc": [{"id": 201, "ltp": 3.5}]},
+    )
+
+    message = provider.handle_stream_message(frame)
+
+    assert message.type == MessageType.MARKET_CHANGE
+    assert message.market_id is None
+    assert [market_prices.market_id for market_prices in message.data] == ["1.1", "1.2"]
+    assert [raw["id"] for raw in message.raw_message] == ["1.1", "1.2"]
+    first, second = message.data
+    assert first.get_runner("101").back_prices[0].price == 1.99
+    assert second.get_runner("201").last_traded_price == 3.5
+
+
+def test_single_market_frame_returns_plain_message(provider):
+    message = provider.handle_stream_message(
+        _frame({"id": "1.1", "rc": [{"id": 101, "ltp": 2.0}]}, {"rc": []})
+    )
+
+    assert message.market_id == "1.1"
+    assert message.data.get_runner("101").last_traded_price == 2.0
+
+
+def test_connected_client_supplies_cached_names(provider):
+    provider.stream_client = BetfairStreamClient("token", "key", "client.pem")
+    provider.stream_client._update_market_definition("1.1", {
+        "name": "Match Odds", "runners": [{"id": 101, "name": "Player A"}]
+    })
+
+    message = provider.handle_stream_message(
+        _frame({"id": "1.1", "rc": [{"id": 101, "ltp": 2.0}]})
+    )
+
+    assert message.data.market_name == "Match Odds"
+    assert message.data.get_runner("101").runner_name == "Player A"
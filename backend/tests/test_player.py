@@ -0,0 +1,32 @@
+"""Tests for interned, immutable Player instances."""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from app.providers.tennis_models import Player
+
+
+def test_get_returns_shared_instance():
+    assert Player.get("1", "Player 1") is Player.get("1", "Player 1")
+    assert Player.get("1", "Player 1") is not Player.get("1", "Other Name")
+
+
+def test_shared_player_cannot_be_mutated():
+    player = Player.get("1", "Player 1")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        player.is_serving = True
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        player.ranking = 5
+
+    assert Player.get("1", "Player 1").is_serving is False
+
+
+def test_frozen_player_copies_and_pickles():
+    player = Player(id="42", name="Player", country="ESP", ranking=3)
+
+    assert copy.deepcopy(player) == player
+    assert pickle.loads(pickle.dumps(player)) == player
@@ -0,0 +1,51 @@
+"""Tests for RiskManager.get_risk_metrics caching."""
+
+import asyncio
+from decimal import Decimal
+
+from app.risk.manager import RiskLimits, RiskManager
+from app.risk.tracker import PositionTracker
+from app.trading.models import OrderSide
+
+
+def _manager() -> RiskManager:
+    return RiskManager(PositionTracker(provider_manager=None), RiskLimits())
+
+
+def test_cache_hit_returns_fresh_independent_copy():
+    manager = _manager()
+    first = manager.get_risk_metrics()
+    first.alerts.append("edited by caller")
+
+    second = manager.get_risk_metrics()
+
+    assert second is not first
+    assert second.alerts == []
+    assert second.timestamp >= first.timestamp
+    assert second.total_exposure == first.total_exposure
+
+
+def test_cache_invalidated_by_tracker_and_loss_changes():
+    async def scenario():
+        manager = _manager()
+        tracker = manager.tracker
+
+        before = manager.get_risk_metrics()
+        position = await tracker.open_position(
+            "1.1", "101", OrderSide.BACK, Decimal("2.0"), Decimal("10"), "order-1"
+        )
+        opened = manager.get_risk_metrics()
+        assert (before.num_open_positions, opened.num_open_positions) == (0, 1)
+
+        await tracker.update_position_price(position.position_id, Decimal("2.5"))
+        repriced = manager.get_risk_metrics()
+        assert repriced.expected_value != opened.expected_value
+
+        await tracker.close_position(position.position_id, Decimal("2.5"))
+        closed = manager.get_risk_metrics()
+        assert closed.num_open_positions == 0
+
+        manager.daily_loss = Decimal("50")
+        assert manager.get_risk_metrics().loss_limit_used == Decimal("25")
+
+    asyncio.run(scenario())
@@ -0,0 +1,53 @@
+"""Tests for TennisScore set counting."""
+
+from app.providers.normalizer import MatchNormalizer
+from app.providers.tennis_models import MatchStatus, Player, SetScore, TennisScore
+
+
+def _score() -> TennisScore:
+    return TennisScore(
+        match_id="m1",
+        player1=Player(id="p1", name="Player One"),
+        player2=Player(id="p2", name="Player Two")
+    )
+
+
+def test_set_completed_in_place_is_counted():
+    score = _score()
+    score.sets.append(SetScore(6, 4, is_completed=True, winner="p1"))
+    score.sets.append(SetScore(3, 2))
+    score.current_set = 2
+    assert score.player1_sets_won == 1
+
+    # Finish the current set through the public accessor
+    current = score.current_set_score
+    current.player1_games = 6
+    current.is_completed = True
+    current.winner = "p1"
+
+    assert score.player1_sets_won == 2
+    assert score.player2_sets_won == 0
+
+
+def test_set_winner_changed_in_place_is_counted():
+    score = _score()
+    score.sets.append(SetScore(7, 6, is_completed=True, winner="p1"))
+    assert (score.player1_sets_won, score.player2_sets_won) == (1, 0)
+
+    score.sets[0].winner = "p2"
+
+    assert (score.player1_sets_won, score.player2_sets_won) == (0, 1)
+
+
+def test_parsed_score_string_sets_and_status():
+    normalizer = MatchNormalizer()
+
+    finished = normalizer.normalize_score("betfair", "6-4 3-6 7-6(7-5)")
+    assert (finished.player1_sets_won, finished.player2_sets_won) == (2, 1)
+    assert finished.match_status == MatchStatus.COMPLETED
+    assert finished.winner.id == finished.player1.id
+
+    live = normalizer.normalize_score("betfair", "4-6 2-1")
+    assert (live.player1_sets_won, live.player2_sets_won) == (0, 1)
+    assert live.match_status == MatchStatus.IN_PROGRESS
+    assert live.winner is None
@@ -127,11 +127,11 @@ def test_live_matches(provider):
                         for price_data in prices:
                             print(f"\n   {price_data.selection_name}:")
                             if price_data.back_prices:
-                                best_back = price_data.back_prices[0]
-                                print(f"     Best Back: {best_back['price']} @ £{best_back['size']:.2f}")
+                                price, size = price_data.back_prices[0]
+                                print(f"     Best Back: {price} @ £{size:.2f}")
                             if price_data.lay_prices:
-                                best_lay = price_data.lay_prices[0]
-                                print(f"     Best Lay: {best_lay['price']} @ £{best_lay['size']:.2f}")
+                                price, size = price_data.lay_prices[0]
+                                print(f"     Best Lay: {price} @ £{size:.2f}")
                             if price_data.last_price_traded:
                                 print(f"     Last Traded: {price_data.last_price_traded}")
         else:
@@ -53,15 +53,18 @@ class StreamingConsole:
     
     def _handle_market_change(self, message: StreamMessage):
         """Handle market price changes."""
-        market_prices = message.data
-        market_id = market_prices.market_id
+        # Coalesced updates carry a list of markets
+        batch = message.data if isinstance(message.data, list) else [message.data]
         
-        # Store market data
-        self.market_data[market_id] = market_prices
-        self.last_update[market_id] = datetime.now()
-        
-        # Display update
-        self._display_market(market_prices)
+        for market_prices in batch:
+            market_id = market_prices.market_id
+            
+            # Store market data
+            self.market_data[market_id] = market_prices
+            self.last_update[market_id] = datetime.now()
+            
+            # Display update
+            self._display_market(market_prices)
     
     def _display_market(self, market_prices):
         """Display market prices in console."""
@@ -94,7 +97,8 @@ class StreamingConsole:
         print(f"{'Runner':<30} {'Back':<20} {'Lay':<20} {'Last Traded':<10}")
         print("-" * 80)
         
-        for runner_id, runner_prices in market_prices.runners.items():
+        for runner_prices in market_prices.runners:
+            runner_id = runner_prices.runner_id
             runner_name = runner_prices.runner_name or f"Runner {runner_id}"
             
             # Format back price
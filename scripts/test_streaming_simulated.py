@@ -123,18 +123,14 @@ class SimulatedStreaming:
             )
             
             # Convert back prices
-            for price_dict in price_data.back_prices:
-                runner_prices.back_prices.append(
-                    PriceVolume(price_dict["price"], price_dict["size"])
-                )
+            for price, size in price_data.back_prices:
+                runner_prices.back_prices.append(PriceVolume(price, size))
             
             # Convert lay prices
-            for price_dict in price_data.lay_prices:
-                runner_prices.lay_prices.append(
-                    PriceVolume(price_dict["price"], price_dict["size"])
-                )
+            for price, size in price_data.lay_prices:
+                runner_prices.lay_prices.append(PriceVolume(price, size))
             
-            market_prices.runners[price_data.selection_id] = runner_prices
+            market_prices.runners.append(runner_prices)
         
         return market_prices
     
@@ -189,15 +185,18 @@ class StreamingConsole:
     
     def _handle_market_change(self, message: StreamMessage):
         """Handle market price changes."""
-        market_prices = message.data
-        market_id = market_prices.market_id
+        # Coalesced updates carry a list of markets
+        batch = message.data if isinstance(message.data, list) else [message.data]
         
-        # Store market data
-        self.market_data[market_id] = market_prices
-        self.last_update[market_id] = datetime.now()
-        
-        # Display update
-        self._display_market(market_prices)
+        for market_prices in batch:
+            market_id = market_prices.market_id
+            
+            # Store market data
+            self.market_data[market_id] = market_prices
+            self.last_update[market_id] = datetime.now()
+            
+            # Display update
+            self._display_market(market_prices)
     
     def _display_market(self, market_prices):
         """Display market prices in console."""
@@ -226,7 +225,8 @@ class StreamingConsole:
         print(f"{'Runner':<35} {'Back':<25} {'Lay':<25} {'Last':<15}")
         print("-" * 100)
         
-        for runner_id, runner_prices in market_prices.runners.items():
+        for runner_prices in market_prices.runners:
+            runner_id = runner_prices.runner_id
             runner_name = runner_prices.runner_name or f"Runner {runner_id}"
             
             # Track price changes